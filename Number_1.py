@@ -1,49 +1,75 @@
 import sys
-from PyQt5 import QtWidgets, uic
+from PyQt5 import QtWidgets
 from PyQt5.QtCore import Qt
 
+from flag_render import COLOR_NAMES, FlagCache, flag_size, flag_svg, render_flag
+from ui_loader import load_ui
+
 
 class TextFlagApp(QtWidgets.QMainWindow):
     def __init__(self):
         super().__init__()
 
         # Загрузка интерфейса из файла
-        uic.loadUi('text_flag.ui', self)
+        load_ui(self, 'text_flag.ui')
 
         # Настройка фиксированного размера окна
-        self.setFixedSize(450, 550)
+        self.setFixedSize(450, 760)
 
-        # Подключение обработчика кнопки
+        # Подключение обработчиков кнопок
         self.drawButton.clicked.connect(self.draw_flag)
+        self.exportButton.clicked.connect(self.export_flag)
+
+        # Группы кнопок цветов для каждой полосы
+        self.top_buttons = [self.top_red, self.top_blue, self.top_green, self.top_yellow, self.top_white]
+        self.middle_buttons = [self.middle_red, self.middle_blue, self.middle_green, self.middle_yellow, self.middle_white]
+        self.bottom_buttons = [self.bottom_red, self.bottom_blue, self.bottom_green, self.bottom_yellow, self.bottom_white]
+
+        # Флаг перерисовывается при выборе другого цвета
+        for button in self.top_buttons + self.middle_buttons + self.bottom_buttons:
+            button.toggled.connect(self.on_color_toggled)
+
+        # Нарисованные флаги и то, что сейчас показано
+        self.flag_cache = FlagCache()
+        self.shown_flag = None
 
         # Словарь для соответствия кнопок и цветов
-        self.color_mapping = {
-            'red': 'Красный',
-            'blue': 'Синий',
-            'green': 'Зеленый',
-            'yellow': 'Желтый',
-            'white': 'Белый'
-        }
+        self.color_mapping = COLOR_NAMES
 
-    def get_selected_color(self, button_group):
-        """Получить выбранный цвет из группы кнопок"""
+    def get_selected_name(self, button_group):
+        """Получить имя выбранного цвета (red, blue, ...) из группы кнопок"""
         for button in button_group:
             if button.isChecked():
                 # Извлекаем название цвета из имени кнопки
-                color_name = button.objectName().split('_')[1]
-                return self.color_mapping.get(color_name, 'Неизвестный')
-        return 'Не выбран'
+                return button.objectName().split('_')[1]
+        return None
+
+    def get_selected_color(self, button_group):
+        """Получить выбранный цвет из группы кнопок"""
+        color_name = self.get_selected_name(button_group)
+        if color_name is None:
+            return 'Не выбран'
+        return self.color_mapping.get(color_name, 'Неизвестный')
+
+    def selected_flag(self):
+        """Цвета полос сверху вниз или None, если какой-то цвет не выбран"""
+        colors = tuple(
+            self.get_selected_name(buttons)
+            for buttons in (self.top_buttons, self.middle_buttons, self.bottom_buttons)
+        )
+        return None if None in colors else colors
+
+    def on_color_toggled(self, checked):
+        # При смене цвета кнопки переключаются парой, флаг рисуется один раз
+        if checked:
+            self.draw_flag()
 
     def draw_flag(self):
         """Обработчик нажатия кнопки 'Нарисовать'"""
         # Получаем цвета для каждой полосы
-        top_buttons = [self.top_red, self.top_blue, self.top_green, self.top_yellow, self.top_white]
-        middle_buttons = [self.middle_red, self.middle_blue, self.middle_green, self.middle_yellow, self.middle_white]
-        bottom_buttons = [self.bottom_red, self.bottom_blue, self.bottom_green, self.bottom_yellow, self.bottom_white]
-
-        top_color = self.get_selected_color(top_buttons)
-        middle_color = self.get_selected_color(middle_buttons)
-        bottom_color = self.get_selected_color(bottom_buttons)
+        top_color = self.get_selected_color(self.top_buttons)
+        middle_color = self.get_selected_color(self.middle_buttons)
+        bottom_color = self.get_selected_color(self.bottom_buttons)
 
         # Формируем результат
         result_text = f"{top_color}, {middle_color}, {bottom_color}"
@@ -51,6 +77,66 @@ class TextFlagApp(QtWidgets.QMainWindow):
         # Обновляем текст метки
         self.resultLabel.setText(result_text)
 
+        # Рисуем флаг, только если выбор действительно изменился
+        colors = self.selected_flag()
+        size = self.flag_pixmap_size()
+        if colors is None or (colors, size) == self.shown_flag:
+            return
+        self.shown_flag = (colors, size)
+
+        pixmap = self.flag_cache.pixmap(colors, size)
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        self.flagLabel.setPixmap(pixmap)
+
+    def flag_pixmap_size(self):
+        """Размер картинки флага в пикселях экрана: наибольший 3:2, что помещается в метку"""
+        ratio = self.devicePixelRatioF()
+        width, height = flag_size(self.flagLabel.contentsRect().width())
+        available = self.flagLabel.contentsRect().height()
+        if height > available:
+            width, height = flag_size(available * 3 // 2)
+        return round(width * ratio), round(height * ratio)
+
+    def showEvent(self, event):
+        """Флаг для выбранных по умолчанию цветов - когда размер метки уже известен"""
+        super().showEvent(event)
+        self.draw_flag()
+
+    def export_flag(self):
+        """Сохранение флага в PNG или SVG заданной ширины"""
+        colors = self.selected_flag()
+        if colors is None:
+            QtWidgets.QMessageBox.warning(self, "Ошибка", "Выберите цвета всех полос!")
+            return
+
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Экспорт флага", "flag.png", "PNG (*.png);;SVG (*.svg)"
+        )
+        if not path:
+            return
+
+        width, ok = QtWidgets.QInputDialog.getInt(
+            self, "Экспорт флага", "Ширина, пикселей:", 900, 3, 20000
+        )
+        if not ok:
+            return
+        size = flag_size(width)
+
+        if path.lower().endswith('.svg'):
+            try:
+                with open(path, 'w', encoding='utf-8') as file:
+                    file.write(flag_svg(colors, *size))
+            except OSError as error:
+                QtWidgets.QMessageBox.warning(self, "Ошибка", f"Не удалось сохранить флаг:\n{error}")
+            return
+
+        # Уже нарисованный флаг такого размера берется из кеша, новый в кеш
+        # не кладется - большие картинки экспорта вытеснили бы флаги окна
+        pixmap = self.flag_cache.find(colors, size)
+        image = pixmap.toImage() if pixmap is not None else render_flag(colors, *size)
+        if not image.save(path, 'PNG'):
+            QtWidgets.QMessageBox.warning(self, "Ошибка", "Не удалось сохранить флаг!")
+
 
 def main():
     app = QtWidgets.QApplication(sys.argv)
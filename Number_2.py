@@ -1,7 +1,290 @@
+import csv
+import os
 import sys
-from PyQt5 import QtWidgets, uic
-from PyQt5.QtCore import QDateTime, Qt
-from PyQt5.QtGui import QFont
+import time
+from PyQt5 import QtWidgets
+from PyQt5.QtCore import (QAbstractListModel, QDate, QDateTime, QModelIndex, QObject, Qt, QThread, QTime,
+                          QTimer, pyqtSignal)
+from PyQt5.QtGui import QColor, QFont, QTextCharFormat
+
+from planner_core import Event, ReminderQueue, insert_position
+from planner_files import EventFileReader, write_events
+from planner_store import EventStore
+from ui_loader import load_ui
+
+
+EVENTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'daily_planner.db')
+
+
+class EventsModel(QAbstractListModel):
+    """Модель списка событий для QListView.
+
+    События читаются из хранилища страницами по мере прокрутки
+    (canFetchMore/fetchMore), а при изменениях модель сообщает лишь о
+    затронутых строках, поэтому ни память, ни время отрисовки не растут
+    с числом событий. Изменения не фиксируются сразу - это делает окно
+    пачкой (EventStore.commit). set_range ограничивает список периодом
+    [start, end); без периода показываются все события.
+    """
+
+    PAGE_SIZE = 500
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.start = None
+        self.end = None
+        # Загруженное начало упорядоченного списка событий периода
+        self.events = []
+        self.total = len(store)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.events)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        # Текст формируется только для строк, которые видны на экране
+        return self.events[index.row()].display_text()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and len(self.events) < self.total
+
+    def fetchMore(self, parent=QModelIndex()):
+        last = self.events[-1] if self.events else None
+        page = self.store.events_after(last, self.PAGE_SIZE, self.start, self.end)
+        if not page:
+            return
+
+        self.beginInsertRows(QModelIndex(), len(self.events), len(self.events) + len(page) - 1)
+        self.events.extend(page)
+        self.endInsertRows()
+
+    def set_range(self, start=None, end=None):
+        """Показ событий периода [start, end) или всех (без границ)"""
+        self.beginResetModel()
+        self.start = start
+        self.end = end
+        self.events.clear()
+        self.total = self.store.count(start, end)
+        self.endResetModel()
+
+    def in_range(self, event):
+        """Попадает ли событие в показываемый период"""
+        return self.start is None or self.start <= event.timestamp < self.end
+
+    def insert_event(self, event):
+        """Сохранение события и вставка его строки.
+
+        Возвращает номер строки или None, если событие не показано: оно
+        вне периода или попало в еще не загруженную часть списка (тогда
+        оно появится при прокрутке).
+        """
+        row = insert_position(self.events, event.timestamp)
+        unloaded = row == len(self.events) and self.canFetchMore()
+
+        self.store.add_event(event, commit=False)
+        if not self.in_range(event):
+            return None
+
+        self.total += 1
+        if unloaded:
+            return None
+
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.events.insert(row, event)
+        self.endInsertRows()
+        return row
+
+    def remove_event(self, row):
+        """Удаление события по номеру строки"""
+        self.store.remove_event(self.events[row], commit=False)
+        self.total -= 1
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.events[row]
+        self.endRemoveRows()
+
+    def clear(self):
+        """Удаление всех событий"""
+        self.store.clear(commit=False)
+
+        self.beginResetModel()
+        self.events.clear()
+        self.total = 0
+        self.endResetModel()
+
+
+class ReminderScheduler(QObject):
+    """Напоминания о наступивших событиях.
+
+    Ближайшие будущие события лежат в куче ReminderQueue, а один
+    QTimer взводится на время ее вершины - без таймера на каждое событие
+    и без опроса, так что в ожидании процессор не занят. События
+    подгружаются из хранилища страницами по возрастанию времени: все,
+    что позже последнего загруженного, будет прочитано, когда куча
+    опустеет. Новое событие попадает в кучу, только если оно раньше
+    этой границы.
+    """
+
+    PAGE_SIZE = 1000
+    # Интервал QTimer ограничен int в миллисекундах - дальний срок ждется в несколько заходов
+    MAX_INTERVAL = 24 * 60 * 60 * 1000
+
+    reminders_due = pyqtSignal(list)
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.queue = ReminderQueue()
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        # Грубый таймер может опоздать на 5% интервала - для суточного это больше часа
+        self.timer.setTimerType(Qt.PreciseTimer)
+        self.timer.timeout.connect(self.on_timeout)
+
+        self.reload()
+
+    def reload(self):
+        """Перезагрузка напоминаний из хранилища (после импорта или очистки)"""
+        self.queue.clear()
+        self.start = int(time.time())
+        self.last_loaded = None
+        self.complete = False
+        self.rearm()
+
+    def load_page(self):
+        """Загрузка следующей страницы будущих событий в кучу"""
+        page = self.store.events_after(self.last_loaded, self.PAGE_SIZE, start=self.start)
+        for event in page:
+            self.queue.push(event)
+
+        if page:
+            self.last_loaded = page[-1]
+        self.complete = len(page) < self.PAGE_SIZE
+
+    def add(self, event):
+        """Напоминание о новом (уже сохраненном) событии"""
+        if event.timestamp <= time.time():
+            return
+
+        loaded = self.last_loaded
+        if self.complete or (event.timestamp, event.event_id) < (loaded.timestamp, loaded.event_id):
+            self.queue.push(event)
+            self.rearm()
+
+    def remove(self, event):
+        """Отмена напоминания об удаленном событии"""
+        self.queue.remove(event.event_id)
+        self.rearm()
+
+    def rearm(self):
+        """Взвод таймера на ближайшее напоминание"""
+        next_time = self.queue.next_time()
+        while next_time is None and not self.complete:
+            self.load_page()
+            next_time = self.queue.next_time()
+
+        if next_time is None:
+            self.timer.stop()
+            return
+
+        delay = max(0.0, next_time - time.time()) * 1000
+        self.timer.start(int(min(delay, self.MAX_INTERVAL)))
+
+    def on_timeout(self):
+        due = self.queue.pop_due(time.time())
+        self.rearm()
+        if due:
+            self.reminders_due.emit(due)
+
+
+class ImportWorker(QThread):
+    """Фоновый разбор файла .ics или .csv: события передаются окну пачками"""
+
+    BATCH_SIZE = 5000
+
+    progress = pyqtSignal(int, int)
+    events_parsed = pyqtSignal(list)
+    import_finished = pyqtSignal(int, int)
+    import_failed = pyqtSignal(str)
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        batch = []
+        imported = 0
+        try:
+            reader = EventFileReader(self.path)
+            for event in reader:
+                if self._cancelled:
+                    return
+                batch.append(event)
+                if len(batch) == self.BATCH_SIZE:
+                    self.events_parsed.emit(batch)
+                    imported += len(batch)
+                    batch = []
+                    # Прогресс в килобайтах, чтобы не переполнить int у QProgressBar
+                    self.progress.emit(reader.bytes_read // 1024, reader.size // 1024)
+        except (OSError, csv.Error) as error:
+            # Ошибка csv (например, незакрытая кавычка) - файл дальше не читается
+            self.import_failed.emit(str(error))
+            return
+
+        if batch:
+            self.events_parsed.emit(batch)
+            imported += len(batch)
+        self.import_finished.emit(imported, reader.skipped)
+
+
+class ExportWorker(QThread):
+    """Фоновая выгрузка всех событий по порядку в файл .ics или .csv"""
+
+    progress = pyqtSignal(int, int)
+    export_finished = pyqtSignal(int)
+    export_failed = pyqtSignal(str)
+
+    def __init__(self, store_path, path, parent=None):
+        super().__init__(parent)
+        self.store_path = store_path
+        self.path = path
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        # У потока свое соединение: WAL позволяет читать параллельно с окном
+        store = EventStore(self.store_path)
+        try:
+            total = len(store)
+            count = write_events(self.path, self.tracked(store.iter_events(), total))
+        except OSError as error:
+            self.export_failed.emit(str(error))
+            return
+        finally:
+            store.close()
+
+        if not self._cancelled:
+            self.export_finished.emit(count)
+
+    def tracked(self, events, total):
+        """События с отметкой прогресса; при отмене выгрузка обрывается"""
+        for number, event in enumerate(events, 1):
+            if self._cancelled:
+                return
+            if number % 5000 == 0:
+                self.progress.emit(number, total)
+            yield event
 
 
 class DailyPlanner(QtWidgets.QMainWindow):
@@ -9,7 +292,7 @@ class DailyPlanner(QtWidgets.QMainWindow):
         super().__init__()
 
         # Загрузка интерфейса из файла
-        uic.loadUi('daily_planner.ui', self)
+        load_ui(self, 'daily_planner.ui')
 
         # Настройка фиксированного размера окна
         self.setFixedSize(800, 600)
@@ -18,9 +301,32 @@ class DailyPlanner(QtWidgets.QMainWindow):
         self.addButton.clicked.connect(self.add_event)
         self.deleteButton.clicked.connect(self.delete_event)
         self.clearButton.clicked.connect(self.clear_events)
+        self.importButton.clicked.connect(self.import_events)
+        self.exportButton.clicked.connect(self.export_events)
 
-        # Инициализация списка событий
-        self.events = []
+        # События хранятся в файле и подгружаются по мере прокрутки
+        self.store = EventStore(EVENTS_PATH)
+        self.events_model = EventsModel(self.store, self)
+        self.eventsList.setModel(self.events_model)
+
+        # Изменения записываются на диск пачкой через секунду после последнего
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(1000)
+        self.save_timer.timeout.connect(self.store.commit)
+
+        # Фоновый импорт или экспорт
+        self.worker = None
+
+        # Напоминания о наступивших событиях
+        self.reminders = ReminderScheduler(self.store, self)
+        self.reminders.reminders_due.connect(self.show_reminders)
+
+        # Период списка следует за выбранной датой, подсветка - за страницей календаря
+        self.rangeComboBox.currentIndexChanged.connect(self.update_range)
+        self.calendarWidget.selectionChanged.connect(self.on_date_selected)
+        self.calendarWidget.currentPageChanged.connect(self.highlight_days)
+        self.highlight_days()
 
         # Настройка шрифта для списка событий
         font = QFont('Courier New', 10)
@@ -38,23 +344,17 @@ class DailyPlanner(QtWidgets.QMainWindow):
         selected_date = self.calendarWidget.selectedDate()
         selected_time = self.timeEdit.time()
 
-        # Создаем объект datetime
-        event_datetime = QDateTime(selected_date, selected_time)
-
-        # Добавляем событие в список
-        event_data = {
-            'datetime': event_datetime,
-            'name': event_name,
-            'display_text': f"{event_datetime.toString('dd.MM.yyyy HH:mm')} - {event_name}"
-        }
-
-        self.events.append(event_data)
+        # Время события в секундах от эпохи
+        event_timestamp = QDateTime(selected_date, selected_time).toSecsSinceEpoch()
 
-        # Сортируем события по дате
-        self.events.sort(key=lambda x: x['datetime'])
-
-        # Обновляем список
-        self.update_events_list()
+        # Вставляем событие на место по дате и показываем его
+        event = Event(event_timestamp, event_name)
+        row = self.events_model.insert_event(event)
+        self.reminders.add(event)
+        self.save_timer.start()
+        if row is not None:
+            self.eventsList.setCurrentIndex(self.events_model.index(row))
+        self.highlight_days()
 
         # Очищаем поле ввода
         self.eventNameEdit.clear()
@@ -63,23 +363,23 @@ class DailyPlanner(QtWidgets.QMainWindow):
 
     def delete_event(self):
         """Удаление выбранного события"""
-        current_row = self.eventsList.currentRow()
+        current_row = self.eventsList.currentIndex().row()
 
         if current_row == -1:
             QtWidgets.QMessageBox.warning(self, "Ошибка", "Выберите событие для удаления!")
             return
 
-        # Удаляем событие из списка
-        del self.events[current_row]
-
-        # Обновляем список
-        self.update_events_list()
+        # Удаляем событие из списка и из напоминаний
+        self.reminders.remove(self.events_model.events[current_row])
+        self.events_model.remove_event(current_row)
+        self.save_timer.start()
+        self.highlight_days()
 
         QtWidgets.QMessageBox.information(self, "Успех", "Событие удалено!")
 
     def clear_events(self):
         """Очистка всех событий"""
-        if not self.events:
+        if not len(self.store):
             QtWidgets.QMessageBox.information(self, "Информация", "Список событий уже пуст!")
             return
 
@@ -92,17 +392,194 @@ class DailyPlanner(QtWidgets.QMainWindow):
         )
 
         if reply == QtWidgets.QMessageBox.Yes:
-            self.events.clear()
-            self.update_events_list()
+            self.events_model.clear()
+            self.reminders.reload()
+            self.save_timer.start()
+            self.highlight_days()
             QtWidgets.QMessageBox.information(self, "Успех", "Все события удалены!")
 
-    def update_events_list(self):
-        """Обновление списка событий"""
-        self.eventsList.clear()
+    def selected_range(self):
+        """Границы периода для выбранной даты: (начало, конец) или (None, None)"""
+        mode = self.rangeComboBox.currentIndex()
+        date = self.calendarWidget.selectedDate()
+        if mode == 0:
+            return None, None
+
+        if mode == 1:
+            first = date
+            last = date
+        elif mode == 2:
+            first = date.addDays(1 - date.dayOfWeek())
+            last = first.addDays(6)
+        else:
+            first = QDate(date.year(), date.month(), 1)
+            last = first.addMonths(1).addDays(-1)
+
+        start = QDateTime(first, QTime(0, 0)).toSecsSinceEpoch()
+        end = QDateTime(last.addDays(1), QTime(0, 0)).toSecsSinceEpoch()
+        return start, end
+
+    def update_range(self):
+        """Показ событий выбранного дня, недели или месяца"""
+        self.events_model.set_range(*self.selected_range())
+
+    def on_date_selected(self):
+        """Смена даты: список перечитывается, только если сменился период
+        (в режиме "Все" и внутри той же недели или месяца - нет)"""
+        if self.selected_range() == (self.events_model.start, self.events_model.end):
+            return
+        self.update_range()
+
+    def highlight_days(self):
+        """Подсветка дней с событиями на видимой странице календаря"""
+        year = self.calendarWidget.yearShown()
+        month = self.calendarWidget.monthShown()
+        # На странице видны и края соседних месяцев
+        first = QDate(year, month, 1).addDays(-7)
+        last = QDate(year, month, 1).addMonths(1).addDays(14)
+        counts = self.store.day_counts(self.date_key(first), self.date_key(last))
+
+        self.calendarWidget.setDateTextFormat(QDate(), QTextCharFormat())
+        for date in (first.addDays(offset) for offset in range(first.daysTo(last) + 1)):
+            count = counts.get(self.date_key(date))
+            if not count:
+                continue
+
+            # Чем больше событий, тем насыщеннее фон дня
+            text_format = QTextCharFormat()
+            text_format.setFontWeight(QFont.Bold)
+            text_format.setBackground(QColor(255, 200, 0, min(60 + 30 * count, 255)))
+            self.calendarWidget.setDateTextFormat(date, text_format)
+
+    @staticmethod
+    def date_key(date):
+        """Дата календаря в виде числа ГГГГММДД (как planner_core.day_key)"""
+        return date.year() * 10000 + date.month() * 100 + date.day()
+
+    def show_reminders(self, events):
+        """Одно уведомление обо всех наступивших событиях"""
+        lines = [event.display_text() for event in events[:10]]
+        if len(events) > 10:
+            lines.append(f"... и еще {len(events) - 10}")
+        QtWidgets.QMessageBox.information(self, "Напоминание", "\n".join(lines))
+
+    def start_worker(self, worker, progress_format):
+        """Запуск фонового импорта или экспорта с общей полосой прогресса"""
+        self.worker = worker
+        self.importButton.setEnabled(False)
+        self.exportButton.setEnabled(False)
+        self.progressBar.setFormat(progress_format)
+        self.progressBar.setMaximum(0)
+        self.progressBar.setValue(0)
+        self.progressBar.setVisible(True)
+
+        self.worker.finished.connect(self.on_worker_stopped)
+        self.worker.start()
+
+    def on_worker_stopped(self):
+        if self.sender() is not self.worker:
+            return
+
+        self.worker = None
+        self.importButton.setEnabled(True)
+        self.exportButton.setEnabled(True)
+        self.progressBar.setVisible(False)
+
+    def on_progress(self, done, total):
+        if self.sender() is not self.worker:
+            return
+
+        self.progressBar.setMaximum(total)
+        self.progressBar.setValue(done)
+
+    def import_events(self):
+        """Импорт событий из файла iCalendar или CSV"""
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self, "Импорт событий", "", "Календари (*.ics *.csv);;Все файлы (*)"
+        )
+        if not path:
+            return
+
+        worker = ImportWorker(path)
+        worker.progress.connect(self.on_progress)
+        worker.events_parsed.connect(self.on_events_parsed)
+        worker.import_finished.connect(self.on_import_finished)
+        worker.import_failed.connect(self.on_import_failed)
+        self.start_worker(worker, "Прочитано: %v из %m КБ")
+
+    def on_events_parsed(self, events):
+        """Очередная пачка импортируемых событий - сразу в хранилище, без обновления списка"""
+        if self.sender() is not self.worker:
+            return
+
+        self.store.add_events(events, commit=False)
+
+    def on_import_finished(self, imported, skipped):
+        """Импорт завершен: список и календарь обновляются один раз"""
+        if self.sender() is not self.worker:
+            return
+
+        self.store.commit()
+        self.update_range()
+        self.highlight_days()
+        self.reminders.reload()
+
+        message = f"Импортировано событий: {imported}"
+        if skipped:
+            message += f"\nПропущено записей с ошибками: {skipped}"
+        QtWidgets.QMessageBox.information(self, "Импорт", message)
+
+    def on_import_failed(self, message):
+        """Импорт прерван: уже сохраненные пачки остаются и показываются"""
+        if self.sender() is not self.worker:
+            return
+
+        self.store.commit()
+        self.update_range()
+        self.highlight_days()
+        self.reminders.reload()
+        QtWidgets.QMessageBox.warning(self, "Ошибка", f"Не удалось обработать файл:\n{message}")
+
+    def export_events(self):
+        """Выгрузка всех событий по порядку в файл iCalendar или CSV"""
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Экспорт событий", "events.ics", "iCalendar (*.ics);;CSV (*.csv)"
+        )
+        if not path:
+            return
+
+        # Поток выгрузки читает файл хранилища - несохраненное записывается сейчас
+        self.save_timer.stop()
+        self.store.commit()
+
+        worker = ExportWorker(self.store.path, path)
+        worker.progress.connect(self.on_progress)
+        worker.export_finished.connect(self.on_export_finished)
+        worker.export_failed.connect(self.on_worker_failed)
+        self.start_worker(worker, "Выгружено: %v из %m")
+
+    def on_export_finished(self, count):
+        if self.sender() is not self.worker:
+            return
+
+        QtWidgets.QMessageBox.information(self, "Экспорт", f"Выгружено событий: {count}")
+
+    def on_worker_failed(self, message):
+        if self.sender() is not self.worker:
+            return
+
+        QtWidgets.QMessageBox.warning(self, "Ошибка", f"Не удалось обработать файл:\n{message}")
+
+    def closeEvent(self, event):
+        """Остановка фоновой задачи и запись несохраненных изменений при закрытии окна"""
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker.wait()
+            self.worker = None
 
-        for event in self.events:
-            item = QtWidgets.QListWidgetItem(event['display_text'])
-            self.eventsList.addItem(item)
+        self.save_timer.stop()
+        self.store.close()
+        super().closeEvent(event)
 
 
 def main():
@@ -1,15 +1,172 @@
+import csv
+import os
 import sys
-from PyQt5 import QtWidgets, uic
-from PyQt5.QtCore import Qt
+from PyQt5 import QtWidgets
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt, QThread, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont
 
+from address_core import (Contact, contact_name_key, contact_phone_key, insert_position, matches_query,
+                          parse_query)
+from address_files import ContactFileReader
+from address_store import ContactStore
+from ui_loader import load_ui
+
+
+CONTACTS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'address_book.db')
+
+
+class ContactsModel(QAbstractListModel):
+    """Модель списка контактов для QListView.
+
+    Контакты читаются из хранилища страницами по мере прокрутки
+    (canFetchMore/fetchMore), а при изменениях модель сообщает лишь о
+    затронутых строках. Изменения не фиксируются сразу - это делает окно
+    пачкой (ContactStore.commit).
+
+    set_filter играет роль QSortFilterProxyModel, но фильтрует в самом
+    хранилище: строка поиска превращается в диапазон ключей индекса,
+    поэтому сужение списка на каждое нажатие клавиши не обходит всю книгу.
+    """
+
+    PAGE_SIZE = 500
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        # Разобранная строка поиска (address_core.parse_query)
+        self.mode = 'name'
+        self.prefix = ''
+        # Загруженное начало списка подходящих контактов
+        self.contacts = []
+        self.exhausted = False
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.contacts)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        return self.contacts[index.row()].display_text()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        last = self.contacts[-1] if self.contacts else None
+        page = self.store.contacts_after(last, self.PAGE_SIZE, self.mode, self.prefix)
+        self.exhausted = len(page) < self.PAGE_SIZE
+        if not page:
+            return
+
+        self.beginInsertRows(QModelIndex(), len(self.contacts), len(self.contacts) + len(page) - 1)
+        self.contacts.extend(page)
+        self.endInsertRows()
+
+    def reload(self):
+        """Чтение списка заново с первой страницы"""
+        self.beginResetModel()
+        self.contacts.clear()
+        self.exhausted = False
+        self.endResetModel()
+        # Первая страница читается сразу, чтобы результат поиска был виден без задержки
+        self.fetchMore()
+
+    def set_filter(self, text):
+        """Показ контактов, имя или номер которых начинается с text"""
+        self.mode, self.prefix = parse_query(text)
+        self.reload()
+
+    def sort_key(self):
+        """Ключ порядка строк при текущем поиске"""
+        return contact_phone_key if self.mode == 'phone' else contact_name_key
+
+    def insert_contact(self, contact):
+        """Сохранение контакта и вставка его строки.
+
+        Возвращает номер строки или None, если контакт не показан: он не
+        подходит под поиск или попал в еще не загруженную часть списка
+        (тогда он появится при прокрутке).
+        """
+        sort_key = self.sort_key()
+        row = insert_position(self.contacts, sort_key(contact), sort_key)
+        unloaded = row == len(self.contacts) and self.canFetchMore()
+
+        self.store.add_contact(contact, commit=False)
+        if unloaded or not matches_query(contact, self.mode, self.prefix):
+            return None
+
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.contacts.insert(row, contact)
+        self.endInsertRows()
+        return row
+
+    def remove_contact(self, row):
+        """Удаление контакта по номеру строки"""
+        self.store.remove_contact(self.contacts[row], commit=False)
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.contacts[row]
+        self.endRemoveRows()
+
+    def clear(self):
+        """Удаление всех контактов"""
+        self.store.clear(commit=False)
+
+        self.beginResetModel()
+        self.contacts.clear()
+        self.exhausted = True
+        self.endResetModel()
+
+
+class ImportWorker(QThread):
+    """Фоновый разбор файла vCard или CSV: контакты передаются окну пачками"""
+
+    BATCH_SIZE = 5000
+
+    progress = pyqtSignal(int, int)
+    contacts_parsed = pyqtSignal(list)
+    import_finished = pyqtSignal(int)
+    import_failed = pyqtSignal(str)
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        batch = []
+        try:
+            reader = ContactFileReader(self.path)
+            for contact in reader:
+                if self._cancelled:
+                    return
+                batch.append(contact)
+                if len(batch) == self.BATCH_SIZE:
+                    self.contacts_parsed.emit(batch)
+                    batch = []
+                    # Прогресс в килобайтах, чтобы не переполнить int
+                    self.progress.emit(reader.bytes_read // 1024, reader.size // 1024)
+        except (OSError, csv.Error) as error:
+            # Ошибка csv (например, незакрытая кавычка) - файл дальше не читается
+            self.import_failed.emit(str(error))
+            return
+
+        if batch:
+            self.contacts_parsed.emit(batch)
+        self.import_finished.emit(reader.errors)
+
 
 class AddressBook(QtWidgets.QMainWindow):
     def __init__(self):
         super().__init__()
 
         # Загрузка интерфейса из файла
-        uic.loadUi('address_book.ui', self)
+        load_ui(self, 'address_book.ui')
 
         # Настройка фиксированного размера окна
         self.setFixedSize(600, 500)
@@ -24,8 +181,23 @@ class AddressBook(QtWidgets.QMainWindow):
         self.nameEdit.returnPressed.connect(self.add_contact)
         self.phoneEdit.returnPressed.connect(self.add_contact)
 
-        # Инициализация списка контактов
-        self.contacts = []
+        # Поиск по мере ввода
+        self.searchEdit.textChanged.connect(self.filter_contacts)
+
+        # Импорт контактов из файла
+        self.actionImport.triggered.connect(self.import_contacts)
+        self.worker = None
+
+        # Контакты хранятся в файле и подгружаются по мере прокрутки
+        self.store = ContactStore(CONTACTS_PATH)
+        self.contacts_model = ContactsModel(self.store, self)
+        self.contactsList.setModel(self.contacts_model)
+
+        # Изменения записываются на диск пачкой через секунду после последнего
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.setInterval(1000)
+        self.save_timer.timeout.connect(self.store.commit)
 
         # Настройка шрифта для списка контактов
         font = QFont('Segoe UI', 10)
@@ -50,28 +222,18 @@ class AddressBook(QtWidgets.QMainWindow):
             self.phoneEdit.setFocus()
             return
 
-        # Проверка на уникальность имени
-        for contact in self.contacts:
-            if contact['name'].lower() == name.lower():
-                QtWidgets.QMessageBox.warning(self, "Ошибка", "Контакт с таким именем уже существует!")
-                self.nameEdit.selectAll()
-                self.nameEdit.setFocus()
-                return
-
-        # Добавляем контакт в список
-        contact_data = {
-            'name': name,
-            'phone': phone,
-            'display_text': f"{name} - {phone}"
-        }
-
-        self.contacts.append(contact_data)
-
-        # Сортируем контакты по имени
-        self.contacts.sort(key=lambda x: x['name'].lower())
+        # Проверка на уникальность имени по индексу хранилища
+        if self.store.find(name) is not None:
+            QtWidgets.QMessageBox.warning(self, "Ошибка", "Контакт с таким именем уже существует!")
+            self.nameEdit.selectAll()
+            self.nameEdit.setFocus()
+            return
 
-        # Обновляем список
-        self.update_contacts_list()
+        # Вставляем контакт на место по алфавиту и показываем его
+        row = self.contacts_model.insert_contact(Contact(name, phone))
+        self.save_timer.start()
+        if row is not None:
+            self.contactsList.setCurrentIndex(self.contacts_model.index(row))
 
         # Очищаем поля ввода
         self.clear_fields()
@@ -89,14 +251,14 @@ class AddressBook(QtWidgets.QMainWindow):
 
     def delete_contact(self):
         """Удаление выбранного контакта"""
-        current_row = self.contactsList.currentRow()
+        current_row = self.contactsList.currentIndex().row()
 
         if current_row == -1:
             QtWidgets.QMessageBox.warning(self, "Ошибка", "Выберите контакт для удаления!")
             return
 
         # Получаем имя контакта для подтверждения
-        contact_name = self.contacts[current_row]['name']
+        contact_name = self.contacts_model.contacts[current_row].name
 
         reply = QtWidgets.QMessageBox.question(
             self,
@@ -108,10 +270,8 @@ class AddressBook(QtWidgets.QMainWindow):
 
         if reply == QtWidgets.QMessageBox.Yes:
             # Удаляем контакт из списка
-            del self.contacts[current_row]
-
-            # Обновляем список
-            self.update_contacts_list()
+            self.contacts_model.remove_contact(current_row)
+            self.save_timer.start()
 
             # Обновляем статус
             self.update_status()
@@ -120,7 +280,7 @@ class AddressBook(QtWidgets.QMainWindow):
 
     def clear_all_contacts(self):
         """Очистка всех контактов"""
-        if not self.contacts:
+        if not len(self.store):
             QtWidgets.QMessageBox.information(self, "Информация", "Список контактов уже пуст!")
             return
 
@@ -133,22 +293,90 @@ class AddressBook(QtWidgets.QMainWindow):
         )
 
         if reply == QtWidgets.QMessageBox.Yes:
-            self.contacts.clear()
-            self.update_contacts_list()
+            self.contacts_model.clear()
+            self.save_timer.start()
             self.update_status()
             QtWidgets.QMessageBox.information(self, "Успех", "Все контакты удалены!")
 
-    def update_contacts_list(self):
-        """Обновление списка контактов"""
-        self.contactsList.clear()
+    def import_contacts(self):
+        """Импорт контактов из файла vCard или CSV"""
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self, "Импорт контактов", "", "Контакты (*.vcf *.vcard *.csv);;Все файлы (*)"
+        )
+        if not path:
+            return
+
+        # Итоги импорта собираются по пачкам и показываются один раз
+        self.imported = 0
+        self.duplicates = []
+
+        self.worker = ImportWorker(path)
+        self.worker.progress.connect(self.on_import_progress)
+        self.worker.contacts_parsed.connect(self.on_contacts_parsed)
+        self.worker.import_finished.connect(self.on_import_finished)
+        self.worker.import_failed.connect(self.on_import_failed)
+        self.worker.finished.connect(self.on_worker_stopped)
+        self.actionImport.setEnabled(False)
+        self.statusbar.showMessage(f"Импорт из {os.path.basename(path)}...")
+        self.worker.start()
+
+    def on_import_progress(self, done, total):
+        if self.sender() is not self.worker:
+            return
+
+        self.statusbar.showMessage(f"Импорт: прочитано {done} из {total} КБ")
+
+    def on_contacts_parsed(self, contacts):
+        """Очередная пачка контактов - сразу в хранилище, без обновления списка"""
+        if self.sender() is not self.worker:
+            return
+
+        added, duplicates = self.store.add_contacts(contacts, commit=False)
+        self.imported += len(added)
+        self.duplicates.extend(contact.name for contact in duplicates)
+
+    def on_import_finished(self, errors):
+        """Импорт завершен: список и статус обновляются один раз"""
+        if self.sender() is not self.worker:
+            return
+
+        self.store.commit()
+        self.contacts_model.reload()
+        self.update_status()
+
+        lines = [f"Добавлено контактов: {self.imported}"]
+        if self.duplicates:
+            examples = ", ".join(self.duplicates[:5])
+            more = f" и еще {len(self.duplicates) - 5}" if len(self.duplicates) > 5 else ""
+            lines.append(f"Пропущено дубликатов: {len(self.duplicates)} ({examples}{more})")
+        if errors:
+            lines.append(f"Пропущено записей без имени или телефона: {errors}")
+        QtWidgets.QMessageBox.information(self, "Импорт", "\n".join(lines))
+
+    def on_import_failed(self, message):
+        """Импорт прерван: уже сохраненные пачки остаются и показываются"""
+        if self.sender() is not self.worker:
+            return
 
-        for contact in self.contacts:
-            item = QtWidgets.QListWidgetItem(contact['display_text'])
-            self.contactsList.addItem(item)
+        self.store.commit()
+        self.contacts_model.reload()
+        self.update_status()
+        QtWidgets.QMessageBox.warning(self, "Ошибка", f"Не удалось прочитать файл:\n{message}")
+
+    def on_worker_stopped(self):
+        if self.sender() is not self.worker:
+            return
+
+        self.worker = None
+        self.actionImport.setEnabled(True)
+
+    def filter_contacts(self, text):
+        """Сужение списка контактов по строке поиска"""
+        self.contacts_model.set_filter(text)
 
     def update_status(self):
         """Обновление статусной строки"""
-        count = len(self.contacts)
+        count = len(self.store)
         if count == 0:
             self.statusbar.showMessage("Список контактов пуст")
         elif count == 1:
@@ -158,6 +386,17 @@ class AddressBook(QtWidgets.QMainWindow):
         else:
             self.statusbar.showMessage(f"{count} контактов в списке")
 
+    def closeEvent(self, event):
+        """Остановка импорта и запись несохраненных изменений при закрытии окна"""
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker.wait()
+            self.worker = None
+
+        self.save_timer.stop()
+        self.store.close()
+        super().closeEvent(event)
+
 
 def main():
     app = QtWidgets.QApplication(sys.argv)
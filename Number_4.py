@@ -1,22 +1,127 @@
 import sys
 import random
-from PyQt5 import QtWidgets, uic
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont
+import shutil
+import tempfile
+from PyQt5 import QtWidgets
+from PyQt5.QtCore import Qt, QObject, QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QFont, QTextCursor
+
+from pseudonym_engine import optimal_move
+from pseudonym_solver import GameSolver
+from ui_loader import load_ui
+
+
+class ComputerMoveWorker(QThread):
+    """Вычисление хода компьютера в фоне, чтобы окно не замирало"""
+
+    move_found = pyqtSignal(int)
+
+    def __init__(self, strategy, stones, parent=None):
+        super().__init__(parent)
+        self.strategy = strategy
+        self.stones = stones
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        stones_to_take = self.strategy(self.stones)
+        if not self._cancelled:
+            self.move_found.emit(stones_to_take)
+
+
+class GameLog(QObject):
+    """Лог игры в QPlainTextEdit.
+
+    Сообщения копятся и выводятся в документ одним изменением за проход
+    цикла событий, поэтому ход с несколькими сообщениями пересчитывает
+    разметку один раз. В документе остается не больше max_blocks
+    последних строк, а весь лог сессии пишется во временный файл - его
+    можно сохранить через export. Окно лога - QPlainTextEdit: у QTextEdit
+    удаление старых строк пересчитывает разметку всего документа.
+    """
+
+    def __init__(self, text_edit, max_blocks, parent=None):
+        super().__init__(parent)
+        self.text_edit = text_edit
+        self.text_edit.document().setMaximumBlockCount(max_blocks)
+        self.pending = []
+        self.history = tempfile.TemporaryFile('w+', encoding='utf-8')
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(0)
+        self.flush_timer.timeout.connect(self.flush)
+
+    def add(self, message):
+        """Сообщение в очередь; вывод - когда цикл событий освободится"""
+        self.pending.append(message)
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush(self):
+        """Вывод накопленных сообщений"""
+        self.flush_timer.stop()
+        if not self.pending:
+            return
+
+        messages, self.pending = self.pending, []
+        self.history.write('\n'.join(messages) + '\n')
+
+        document = self.text_edit.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        for message in messages:
+            if not document.isEmpty():
+                cursor.insertBlock()
+            cursor.insertText(message)
+        cursor.endEditBlock()
+
+        # Автопрокрутка к последнему сообщению
+        scroll_bar = self.text_edit.verticalScrollBar()
+        scroll_bar.setValue(scroll_bar.maximum())
+
+    def clear(self):
+        """Очистка окна лога; в файле сессии все сохраняется"""
+        self.flush()
+        self.text_edit.clear()
+
+    def export(self, path):
+        """Сохранение всего лога сессии в файл"""
+        self.flush()
+        self.history.flush()
+        self.history.seek(0)
+        try:
+            with open(path, 'w', encoding='utf-8') as file:
+                shutil.copyfileobj(self.history, file)
+        finally:
+            self.history.seek(0, 2)
+
+    def close(self):
+        self.flush_timer.stop()
+        self.history.close()
 
 
 class PseudonymGame(QtWidgets.QMainWindow):
+    # Сколько компьютер может думать над ходом; не успел - ходит наугад
+    THINK_BUDGET_MS = 2000
+    # Сколько последних строк лога показывается в окне
+    LOG_MAX_BLOCKS = 1000
+
     def __init__(self):
         super().__init__()
 
         # Загрузка интерфейса из файла
-        uic.loadUi('pseudonym_game.ui', self)
+        load_ui(self, 'pseudonym_game.ui')
 
         # Настройка фиксированного размера окна
         self.setFixedSize(500, 600)
 
         # Подключение обработчиков
         self.newGameButton.clicked.connect(self.start_new_game)
+        self.saveLogButton.clicked.connect(self.save_log)
         self.take1Button.clicked.connect(lambda: self.player_turn(1))
         self.take2Button.clicked.connect(lambda: self.player_turn(2))
         self.take3Button.clicked.connect(lambda: self.player_turn(3))
@@ -26,21 +131,34 @@ class PseudonymGame(QtWidgets.QMainWindow):
         self.current_stones = 0
         self.game_active = False
 
+        # Стратегия компьютера: взять 1, 2 или 3 камня, взявший последний побеждает
+        self.solver = GameSolver(moves=(1, 2, 3))
+
+        # Ход компьютера считается в фоне, таймер ограничивает время на него
+        self.worker = None
+        self.think_timer = QTimer(self)
+        self.think_timer.setSingleShot(True)
+        self.think_timer.timeout.connect(self.on_think_timeout)
+
         # Настройка шрифта для лога
         font = QFont('Courier New', 9)
         self.logText.setFont(font)
+        self.log = GameLog(self.logText, self.LOG_MAX_BLOCKS, self)
 
         # Блокировка кнопок хода до начала игры
         self.set_move_buttons_enabled(False)
 
     def start_new_game(self):
         """Начало новой игры"""
+        # Ход компьютера из прошлой игры больше не нужен
+        self.cancel_computer_turn()
+
         self.total_stones = self.stonesSpinBox.value()
         self.current_stones = self.total_stones
         self.game_active = True
 
         # Очистка лога
-        self.logText.clear()
+        self.log.clear()
 
         # Обновление интерфейса
         self.update_stones_display()
@@ -60,11 +178,11 @@ class PseudonymGame(QtWidgets.QMainWindow):
 
     def player_turn(self, stones_to_take):
         """Ход игрока"""
-        if not self.game_active:
+        if not self.game_active or self.worker is not None:
             return
 
         # Проверка валидности хода
-        if stones_to_take < 1 or stones_to_take > 3:
+        if stones_to_take not in self.solver.moves:
             QtWidgets.QMessageBox.warning(self, "Ошибка", "Можно взять только 1, 2 или 3 камня!")
             return
 
@@ -85,21 +203,53 @@ class PseudonymGame(QtWidgets.QMainWindow):
         self.turnLabel.setText("Ход компьютера...")
         self.turnLabel.setStyleSheet("font-size: 14px; color: #e67e22; font-weight: bold;")
         self.set_move_buttons_enabled(False)
-
-        # Задержка для имитации "думания" компьютера
-        QtWidgets.QApplication.processEvents()
-        QtWidgets.QApplication.processEvents()
+        self.update_stones_display()
 
         # Выполняем ход компьютера
         self.computer_turn()
 
     def computer_turn(self):
-        """Ход компьютера с выигрышной стратегией"""
+        """Ход компьютера с выигрышной стратегией.
+
+        Оптимальный ход вычисляется в фоновом потоке, окно в это время
+        отвечает на действия пользователя. Результат приходит сигналом
+        move_found.
+        """
         if self.current_stones == 0:
             return
 
-        # Вычисляем оптимальный ход
-        stones_to_take = self.calculate_computer_move()
+        self.worker = ComputerMoveWorker(self.calculate_computer_move, self.current_stones, self)
+        self.worker.move_found.connect(self.on_move_found)
+        self.worker.finished.connect(self.worker.deleteLater)
+        self.worker.start()
+        self.think_timer.start(self.THINK_BUDGET_MS)
+
+    def on_move_found(self, stones_to_take):
+        if self.sender() is not self.worker:
+            return
+
+        self.make_computer_move(stones_to_take)
+
+    def on_think_timeout(self):
+        """Компьютер не уложился во время на ход - ход наугад"""
+        if self.worker is None:
+            return
+
+        self.cancel_computer_turn()
+        self.add_to_log("⏱ Компьютер не успел подумать и ходит наугад")
+        self.make_computer_move(random.choice(self.solver.legal_moves(self.current_stones)))
+
+    def cancel_computer_turn(self):
+        """Отмена хода компьютера, который еще считается"""
+        self.think_timer.stop()
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker = None
+
+    def make_computer_move(self, stones_to_take):
+        """Выполнение вычисленного хода компьютера"""
+        self.think_timer.stop()
+        self.worker = None
 
         # Ход компьютера
         self.current_stones -= stones_to_take
@@ -116,21 +266,17 @@ class PseudonymGame(QtWidgets.QMainWindow):
         self.set_move_buttons_enabled(True)
         self.update_stones_display()
 
-    def calculate_computer_move(self):
-        """Вычисление оптимального хода для компьютера"""
-        # Выигрышная стратегия: оставлять противнику количество камней, кратное 4
-        remainder = self.current_stones % 4
-
-        if remainder == 0:
-            # Если текущее количество кратно 4, берем случайное количество (1-3)
-            return random.randint(1, min(3, self.current_stones))
-        else:
-            # Берем столько, чтобы оставить кратное 4
-            return remainder
+    def calculate_computer_move(self, stones):
+        """Вычисление оптимального хода для компьютера (вызывается в фоновом потоке)"""
+        # Выигрышная стратегия: оставлять противнику проигрышную позицию
+        # (для ходов 1-3 - количество камней, кратное 4), из проигрышной
+        # позиции - случайный ход. Скорость и правильность проверяет
+        # pseudonym_simulator.py --benchmark
+        return optimal_move(self.solver, stones)
 
     def is_winning_position(self, stones):
         """Проверка, является ли позиция выигрышной для ходящего"""
-        return stones % 4 != 0
+        return self.solver.is_winning(stones)
 
     def game_over(self, winner):
         """Завершение игры"""
@@ -177,11 +323,28 @@ class PseudonymGame(QtWidgets.QMainWindow):
 
     def add_to_log(self, message):
         """Добавление сообщения в лог"""
-        self.logText.append(message)
-        # Автопрокрутка к последнему сообщению
-        self.logText.verticalScrollBar().setValue(
-            self.logText.verticalScrollBar().maximum()
+        self.log.add(message)
+
+    def save_log(self):
+        """Сохранение всего лога сессии в текстовый файл"""
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Сохранить лог", "pseudonym_game_log.txt", "Текстовые файлы (*.txt)"
         )
+        if not path:
+            return
+
+        try:
+            self.log.export(path)
+        except OSError as error:
+            QtWidgets.QMessageBox.warning(self, "Ошибка", f"Не удалось сохранить лог:\n{error}")
+
+    def closeEvent(self, event):
+        """Ожидание фоновых вычислений хода и закрытие лога при закрытии окна"""
+        self.cancel_computer_turn()
+        for worker in self.findChildren(ComputerMoveWorker):
+            worker.wait()
+        self.log.close()
+        super().closeEvent(event)
 
 
 def main():
@@ -1,29 +1,277 @@
+import os
 import sys
-import re
-from difflib import SequenceMatcher
-from PyQt5 import QtWidgets, uic
-from PyQt5.QtCore import Qt
+from PyQt5 import QtWidgets
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt5.QtGui import QFont, QColor
 
+import plagiarism_core
+from plagiarism_files import StreamingShingles, TextFileReader, read_text_file
+from plagiarism_store import CorpusStore
+from ui_loader import load_ui
+
+
+# Файл корпуса рядом с программой, чтобы он сохранялся между запусками
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'plagiarism_corpus.db')
+
+
+class DocumentStats:
+    """Счетчики символов и слов документа, обновляемые по изменениям.
+
+    Слова не переходят через границу абзаца, поэтому число слов хранится
+    по абзацам (блокам QTextDocument), а при правке пересчитываются только
+    затронутые блоки - стоимость нажатия клавиши не зависит от размера текста.
+    """
+
+    def __init__(self, document):
+        self.document = document
+        self.block_words = [len(block.text().split()) for block in self.blocks(document.begin())]
+        self.word_count = sum(self.block_words)
+        document.contentsChange.connect(self.on_contents_change)
+
+    def blocks(self, block, last_number=None):
+        """Блоки документа начиная с block (до last_number включительно)"""
+        while block.isValid() and (last_number is None or block.blockNumber() <= last_number):
+            yield block
+            block = block.next()
+
+    def on_contents_change(self, position, chars_removed, chars_added):
+        """Пересчет слов в блоках, затронутых правкой"""
+        end = min(position + chars_added, self.document.characterCount() - 1)
+        first = self.document.findBlock(position)
+        last_number = self.document.findBlock(end).blockNumber()
+
+        # Блоки после правки только сдвинулись; сколько их добавилось или исчезло
+        # внутри правки - видно по изменению общего числа блоков
+        added_blocks = self.document.blockCount() - len(self.block_words)
+        old_range = slice(first.blockNumber(), last_number - added_blocks + 1)
+
+        new_counts = [len(block.text().split()) for block in self.blocks(first, last_number)]
+        self.word_count += sum(new_counts) - sum(self.block_words[old_range])
+        self.block_words[old_range] = new_counts
+
+    def char_count(self):
+        return self.document.characterCount() - 1
+
+    def shingles(self):
+        """Слова и биграммы всего текста, собранные из кэша предобработки строк"""
+        words = set()
+        bigrams = set()
+        previous_word = None
+
+        for block in self.blocks(self.document.begin()):
+            processed, block_words, block_bigrams = plagiarism_core.shingle_cache.get(block.text())
+            if not processed:
+                continue
+
+            words |= block_words
+            bigrams |= block_bigrams
+            # Биграмма на стыке строк
+            if previous_word is not None:
+                bigrams.add(previous_word + ' ' + processed.split(' ', 1)[0])
+            previous_word = processed.rsplit(' ', 1)[-1]
+
+        return words, bigrams
+
+
+class PlagiarismWorker(QThread):
+    """Фоновая проверка на плагиат, чтобы окно не зависало на больших текстах"""
+
+    similarity_ready = pyqtSignal(float)
+    progress = pyqtSignal(int, int)
+    fragments_found = pyqtSignal(list)
+    check_finished = pyqtSignal(float, list)
+
+    def __init__(self, checker, text1, text2, sequence='chars', threshold=0.0, parent=None):
+        super().__init__(parent)
+        self.checker = checker
+        self.text1 = text1
+        self.text2 = text2
+        self.sequence = sequence
+        self.threshold = threshold
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cancelled = False
+
+    def cancel(self):
+        """Запрос на остановку проверки (срабатывает между строками)"""
+        self._cancelled = True
+
+    def run(self):
+        # Счетчики потока проверки: другие проверки и подсветка идут в своих потоках
+        hits, misses = plagiarism_core.shingle_cache.thread_stats()
+
+        similarity = self.checker.calculate_similarity(self.text1, self.text2, self.sequence, self.threshold)
+        if self._cancelled:
+            return
+        self.similarity_ready.emit(similarity)
+
+        similar_lines = []
+        total = len(self.text1.split('\n'))
+        for line_num, matches in self.checker.iter_similar_lines(self.text1, self.text2):
+            if self._cancelled:
+                return
+            if matches:
+                similar_lines.extend(matches)
+                self.fragments_found.emit(matches)
+            self.progress.emit(line_num, total)
+
+        # Работа кэша предобработки за эту проверку
+        hits_after, misses_after = plagiarism_core.shingle_cache.thread_stats()
+        self.cache_hits = hits_after - hits
+        self.cache_misses = misses_after - misses
+
+        self.check_finished.emit(similarity, similar_lines)
+
+
+class FileLoadWorker(QThread):
+    """Потоковая загрузка большого файла: только слова, биграммы и начало текста"""
+
+    progress = pyqtSignal(int, int)
+    file_loaded = pyqtSignal(dict)
+    load_failed = pyqtSignal(str)
+
+    def __init__(self, side, path, parent=None):
+        super().__init__(parent)
+        self.side = side
+        self.path = path
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        shingles = StreamingShingles()
+        try:
+            reader = TextFileReader(self.path)
+            for part in reader:
+                if self._cancelled:
+                    return
+                shingles.feed(part)
+                # Прогресс в килобайтах, чтобы не переполнить int у QProgressBar
+                self.progress.emit(reader.bytes_read // 1024, reader.size // 1024)
+        except OSError as error:
+            self.load_failed.emit(str(error))
+            return
+        shingles.finish()
+
+        self.file_loaded.emit({
+            'path': self.path,
+            'encoding': reader.encoding,
+            'preview': shingles.preview,
+            'words': shingles.words,
+            'bigrams': shingles.bigrams,
+            'word_count': shingles.word_count,
+            'char_count': shingles.char_count
+        })
+
+
+class CorpusLoadWorker(QThread):
+    """Фоновая загрузка файлов в корпус документов"""
+
+    progress = pyqtSignal(int, int)
+    corpus_loaded = pyqtSignal(int)
+
+    def __init__(self, corpus, paths, parent=None):
+        super().__init__(parent)
+        self.corpus = corpus
+        self.paths = paths
+        self._cancelled = False
+
+    def cancel(self):
+        """Запрос на остановку загрузки (срабатывает между файлами)"""
+        self._cancelled = True
+
+    def run(self):
+        loaded = 0
+        for done, path in enumerate(self.paths, 1):
+            if self._cancelled:
+                break
+            try:
+                self.corpus.add_document(path, read_text_file(path), commit=False)
+                loaded += 1
+            except OSError:
+                pass
+            if done % 200 == 0:
+                self.corpus.commit()
+            self.progress.emit(done, len(self.paths))
+
+        # Уже загруженные документы сохраняются и при отмене
+        self.corpus.commit()
+        if not self._cancelled:
+            self.corpus_loaded.emit(loaded)
+
+
+class CorpusQueryWorker(QThread):
+    """Фоновый поиск похожих документов в корпусе"""
+
+    query_finished = pyqtSignal(list)
+
+    def __init__(self, corpus, text, top_k=10, sequence='chars', threshold=0.0, parent=None):
+        super().__init__(parent)
+        self.corpus = corpus
+        self.text = text
+        self.top_k = top_k
+        self.sequence = sequence
+        self.threshold = threshold
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def run(self):
+        results = self.corpus.query(self.text, self.top_k, self.sequence, self.threshold)
+        if not self._cancelled:
+            self.query_finished.emit(results)
+
 
 class PlagiarismChecker(QtWidgets.QMainWindow):
     def __init__(self):
         super().__init__()
 
         # Загрузка интерфейса из файла
-        uic.loadUi('plagiarism_checker.ui', self)
-
-        # Настройка фиксированного размера окна
-        self.setFixedSize(900, 700)
+        load_ui(self, 'plagiarism_checker.ui')
 
         # Подключение обработчиков
         self.checkButton.clicked.connect(self.check_plagiarism)
         self.clearButton.clicked.connect(self.clear_all)
+        self.cancelButton.clicked.connect(self.cancel_check)
+        self.loadCorpusButton.clicked.connect(self.load_corpus)
+        self.corpusCheckButton.clicked.connect(self.check_corpus)
+
+        # Корпус документов для проверки одного текста против многих
+        self.corpus = CorpusStore(CORPUS_PATH)
+        self.corpus_top_k = 10
+
+        # Фоновая проверка: текущая и отмененные, но еще не завершившиеся
+        self.worker = None
+        self.retired_workers = []
+        self.fragment_count = 0
 
         # Подключение обработчиков изменения текста для статистики
+        self.text1_stats = DocumentStats(self.originalTextEdit.document())
+        self.text2_stats = DocumentStats(self.checkedTextEdit.document())
         self.originalTextEdit.textChanged.connect(self.update_text1_stats)
         self.checkedTextEdit.textChanged.connect(self.update_text2_stats)
 
+        # Предварительная оценка схожести пересчитывается после паузы в наборе
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(500)
+        self.preview_timer.timeout.connect(self.update_preview)
+        self.originalTextEdit.textChanged.connect(self.schedule_preview)
+        self.checkedTextEdit.textChanged.connect(self.schedule_preview)
+        self.livePreviewCheckBox.toggled.connect(self.schedule_preview)
+
+        # Тексты, загруженные из файлов потоково (в поле только их начало)
+        self.loaded_files = {}
+        self.openFile1Button.clicked.connect(lambda: self.open_file(1))
+        self.openFile2Button.clicked.connect(lambda: self.open_file(2))
+
+        # Способы последовательного сравнения (см. plagiarism_core.SEQUENCE_BACKENDS)
+        self.sequenceComboBox.addItem("Посимвольно (точно)", 'chars')
+        self.sequenceComboBox.addItem("По словам (быстро)", 'tokens')
+        self.sequenceComboBox.addItem("С отсечением по порогу", 'bounded')
+
         # Настройка шрифтов
         font = QFont('Courier New', 10)
         self.detailsTextEdit.setFont(font)
@@ -37,100 +285,323 @@ class PlagiarismChecker(QtWidgets.QMainWindow):
 
     def preprocess_text(self, text):
         """Предобработка текста: приведение к нижнему регистру и удаление лишних символов"""
-        text = text.lower()
-        text = re.sub(r'[^\w\s]', '', text)  # Удаляем пунктуацию
-        text = re.sub(r'\s+', ' ', text)  # Заменяем множественные пробелы на один
-        return text.strip()
+        return plagiarism_core.preprocess_text(text)
 
-    def calculate_similarity(self, text1, text2):
+    def calculate_similarity(self, text1, text2, sequence='chars', threshold=0.0):
         """Расчет схожести текстов с использованием нескольких методов"""
+        return plagiarism_core.calculate_similarity(text1, text2, sequence, threshold)
+
+    def iter_similar_lines(self, text1, text2):
+        """Поиск похожих строк по одной строке исходного текста за раз"""
+        return plagiarism_core.iter_similar_lines(text1, text2)
+
+    def find_similar_lines(self, text1, text2):
+        """Поиск похожих строк в текстах"""
+        return plagiarism_core.find_similar_lines(text1, text2)
+
+    def check_plagiarism(self):
+        """Основная функция проверки на плагиат"""
+        text1 = self.originalTextEdit.toPlainText().strip()
+        text2 = self.checkedTextEdit.toPlainText().strip()
+
         if not text1 or not text2:
-            return 0.0
+            QtWidgets.QMessageBox.warning(self, "Ошибка", "Оба текстовых поля должны быть заполнены!")
+            return
+
+        if self.loaded_files:
+            self.check_loaded_files()
+            return
+
+        # Незавершенная проверка отменяется и заменяется новой
+        worker = PlagiarismWorker(
+            self, text1, text2, self.sequenceComboBox.currentData(), self.thresholdSpinBox.value()
+        )
+        worker.similarity_ready.connect(self.on_similarity_ready)
+        worker.progress.connect(self.on_check_progress)
+        worker.fragments_found.connect(self.on_fragments_found)
+        worker.check_finished.connect(self.on_check_finished)
+        self.start_worker(worker, len(text1.split('\n')), "Идет проверка...")
+        self.progressBar.setFormat("Проверено строк: %v из %m")
+
+        self.fragment_count = 0
+        self.detailsTextEdit.clear()
+        self.similarityLabel.setText("Схожесть: ...")
+
+    def stop_worker(self):
+        """Отмена текущей фоновой проверки, если она еще идет"""
+        if self.worker is None:
+            return
 
-        # Метод 1: Сравнение по словам (Jaccard similarity)
-        words1 = set(self.preprocess_text(text1).split())
-        words2 = set(self.preprocess_text(text2).split())
+        self.worker.cancel()
+        if isinstance(self.worker, (CorpusLoadWorker, CorpusQueryWorker)):
+            # Корпус не рассчитан на одновременный доступ из нескольких потоков
+            self.worker.wait()
+        if self.worker.isRunning():
+            # Поток доработает до ближайшей строки; держим ссылку до его завершения
+            self.retired_workers.append(self.worker)
+        self.worker = None
+
+        self.progressBar.setVisible(False)
+        self.cancelButton.setEnabled(False)
+
+    def start_worker(self, worker, progress_total, message):
+        """Запуск фоновой задачи вместо текущей"""
+        self.stop_worker()
+
+        self.progressBar.setMaximum(progress_total)
+        self.progressBar.setValue(0)
+        self.progressBar.setVisible(True)
+        self.cancelButton.setEnabled(True)
+        self.statusbar.setStyleSheet("")
+        self.statusbar.showMessage(message)
+
+        self.worker = worker
+        self.worker.finished.connect(self.on_worker_stopped)
+        self.worker.start()
+
+    def load_corpus(self):
+        """Загрузка текстовых файлов из папки в корпус"""
+        directory = QtWidgets.QFileDialog.getExistingDirectory(self, "Папка с документами корпуса")
+        if not directory:
+            return
+
+        paths = [
+            os.path.join(root, name)
+            for root, _, names in os.walk(directory)
+            for name in sorted(names)
+            if name.lower().endswith('.txt')
+        ]
+        if not paths:
+            QtWidgets.QMessageBox.warning(self, "Ошибка", "В выбранной папке нет файлов .txt!")
+            return
+
+        worker = CorpusLoadWorker(self.corpus, paths)
+        worker.progress.connect(self.on_check_progress)
+        worker.corpus_loaded.connect(self.on_corpus_loaded)
+        self.start_worker(worker, len(paths), "Загрузка корпуса...")
+        self.progressBar.setFormat("Загружено файлов: %v из %m")
+
+    def on_corpus_loaded(self, loaded):
+        """Корпус загружен"""
+        if self.sender() is not self.worker:
+            return
+
+        self.statusbar.showMessage(f"Загружено документов: {loaded}. Всего в корпусе: {len(self.corpus)}")
 
-        if not words1 or not words2:
-            return 0.0
+    def check_corpus(self):
+        """Проверка текста против всех документов корпуса"""
+        text = self.checkedTextEdit.toPlainText().strip()
 
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
-        jaccard_similarity = len(intersection) / len(union) * 100
+        if not text:
+            QtWidgets.QMessageBox.warning(self, "Ошибка", "Введите проверяемый текст!")
+            return
+
+        if 2 in self.loaded_files:
+            QtWidgets.QMessageBox.warning(self, "Ошибка", "Проверка по корпусу доступна только для введенного текста!")
+            return
 
-        # Метод 2: Последовательное сравнение (SequenceMatcher)
-        seq_similarity = SequenceMatcher(None, text1, text2).ratio() * 100
+        if not len(self.corpus):
+            QtWidgets.QMessageBox.warning(self, "Ошибка", "Корпус пуст. Сначала загрузите документы!")
+            return
 
-        # Метод 3: Сравнение по n-граммам (биграммы)
-        def get_ngrams(text, n=2):
-            words = text.split()
-            return [' '.join(words[i:i + n]) for i in range(len(words) - n + 1)]
+        worker = CorpusQueryWorker(
+            self.corpus, text, self.corpus_top_k, self.sequenceComboBox.currentData(), self.thresholdSpinBox.value()
+        )
+        worker.query_finished.connect(self.on_corpus_checked)
+        self.start_worker(worker, 0, "Поиск по корпусу...")
+        self.detailsTextEdit.clear()
+
+    def on_corpus_checked(self, results):
+        """Вывод документов корпуса, похожих на проверяемый текст"""
+        if self.sender() is not self.worker:
+            return
 
-        ngrams1 = set(get_ngrams(self.preprocess_text(text1), 2))
-        ngrams2 = set(get_ngrams(self.preprocess_text(text2), 2))
+        text = self.worker.text
+        similarity = results[0]['similarity'] if results else 0.0
+        self.show_similarity(similarity)
 
-        if ngrams1 and ngrams2:
-            ngram_similarity = len(ngrams1.intersection(ngrams2)) / len(ngrams1.union(ngrams2)) * 100
+        details = f"ПРОВЕРКА ПО КОРПУСУ (документов: {len(self.corpus)})\n"
+        details += f"Проверяемый текст: {len(text.split())} слов, {len(text)} символов\n\n"
+
+        if results:
+            details += "НАЙДЕНЫ ПОХОЖИЕ ДОКУМЕНТЫ:\n"
+            details += "=" * 50 + "\n"
+
+            for i, result in enumerate(results, 1):
+                details += f"\nДокумент #{i} (схожесть: {result['similarity']}%, "
+                details += f"оценка MinHash: {result['estimated_similarity']}%):\n"
+                details += f"{result['doc_id']}\n"
+                details += "-" * 30 + "\n"
         else:
-            ngram_similarity = 0.0
+            details += "Похожих документов не найдено.\n"
 
-        # Взвешенное среднее всех методов
-        similarity = (jaccard_similarity * 0.4 + seq_similarity * 0.3 + ngram_similarity * 0.3)
+        self.detailsTextEdit.setPlainText(details)
+        self.progressBar.setVisible(False)
+        self.cancelButton.setEnabled(False)
+
+        threshold = self.thresholdSpinBox.value()
+        self.check_threshold(similarity, threshold)
 
-        return round(similarity, 2)
+    def open_file(self, side):
+        """Потоковая загрузка текстового файла в одно из полей"""
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self, "Открыть текстовый файл", "", "Текстовые файлы (*.txt);;Все файлы (*)"
+        )
+        if not path:
+            return
 
-    def find_similar_lines(self, text1, text2):
-        """Поиск похожих строк в текстах"""
-        lines1 = text1.split('\n')
-        lines2 = text2.split('\n')
+        worker = FileLoadWorker(side, path)
+        worker.progress.connect(self.on_file_progress)
+        worker.file_loaded.connect(self.on_file_loaded)
+        worker.load_failed.connect(self.on_file_load_failed)
+        self.start_worker(worker, 0, f"Загрузка файла {os.path.basename(path)}...")
+        self.progressBar.setFormat("Прочитано: %v из %m КБ")
 
-        similar_lines = []
+    def on_file_progress(self, done, total):
+        if self.sender() is not self.worker:
+            return
 
-        for i, line1 in enumerate(lines1, 1):
-            if not line1.strip():
-                continue
+        self.progressBar.setMaximum(total)
+        self.progressBar.setValue(done)
 
-            for j, line2 in enumerate(lines2, 1):
-                if not line2.strip():
-                    continue
+    def on_file_loaded(self, info):
+        """Файл прочитан: в поле показывается только его начало"""
+        if self.sender() is not self.worker:
+            return
 
-                line_similarity = self.calculate_similarity(line1, line2)
-                if line_similarity > 50:  # Порог для похожих строк
-                    similar_lines.append({
-                        'line1_num': i,
-                        'line1_text': line1,
-                        'line2_num': j,
-                        'line2_text': line2,
-                        'similarity': line_similarity
-                    })
+        side = self.worker.side
+        text_edit = self.originalTextEdit if side == 1 else self.checkedTextEdit
 
-        return similar_lines
+        self.loaded_files.pop(side, None)
+        text_edit.setReadOnly(False)
+        text_edit.setPlainText(info['preview'])
+        text_edit.setReadOnly(True)
+        self.loaded_files[side] = info
 
-    def check_plagiarism(self):
-        """Основная функция проверки на плагиат"""
-        text1 = self.originalTextEdit.toPlainText().strip()
-        text2 = self.checkedTextEdit.toPlainText().strip()
+        self.update_text1_stats()
+        self.update_text2_stats()
+        self.statusbar.showMessage(f"Файл загружен: {info['path']} ({info['encoding']})")
 
-        if not text1 or not text2:
-            QtWidgets.QMessageBox.warning(self, "Ошибка", "Оба текстовых поля должны быть заполнены!")
+    def on_file_load_failed(self, message):
+        if self.sender() is not self.worker:
             return
 
-        # Расчет общей схожести
-        similarity = self.calculate_similarity(text1, text2)
+        self.statusbar.clearMessage()
+        QtWidgets.QMessageBox.warning(self, "Ошибка", f"Не удалось прочитать файл:\n{message}")
+
+    def side_shingles(self, side):
+        """Слова и биграммы поля: из загруженного файла или из введенного текста"""
+        if side in self.loaded_files:
+            info = self.loaded_files[side]
+            return info['words'], info['bigrams']
+        return (self.text1_stats if side == 1 else self.text2_stats).shingles()
+
+    def check_loaded_files(self):
+        """Проверка, когда хотя бы один текст загружен из файла.
+
+        Полных текстов в памяти нет, поэтому считается схожесть по словам
+        и биграммам, без посимвольного сравнения и поиска фрагментов.
+        """
+        self.stop_worker()
+
+        similarity = plagiarism_core.shingles_similarity(self.side_shingles(1), self.side_shingles(2))
+        self.show_similarity(similarity)
+
+        details = f"ОБЩАЯ СХОЖЕСТЬ (по словам и биграммам): {similarity}%\n"
+        for side, title in ((1, "Исходный текст"), (2, "Проверяемый текст")):
+            if side in self.loaded_files:
+                info = self.loaded_files[side]
+                details += (f"{title}: файл {info['path']} ({info['encoding']}), "
+                            f"{info['word_count']} слов, {info['char_count']} символов\n")
+            else:
+                stats = self.text1_stats if side == 1 else self.text2_stats
+                details += f"{title}: {stats.word_count} слов, {stats.char_count()} символов\n"
+        details += "\nПоиск похожих фрагментов для загруженных файлов не выполняется.\n"
 
-        # Поиск похожих строк
-        similar_lines = self.find_similar_lines(text1, text2)
+        self.detailsTextEdit.setPlainText(details)
 
-        # Обновление интерфейса
-        self.update_results(similarity, similar_lines, text1, text2)
+        threshold = self.thresholdSpinBox.value()
+        self.check_threshold(similarity, threshold)
+
+    def cancel_check(self):
+        """Обработчик кнопки 'Отменить'"""
+        if self.worker is None:
+            return
+
+        self.stop_worker()
+        self.statusbar.showMessage("Проверка отменена")
+
+    def on_similarity_ready(self, similarity):
+        """Общая схожесть посчитана, начинается поиск фрагментов"""
+        if self.sender() is not self.worker:
+            return
+
+        self.show_similarity(similarity)
+        self.detailsTextEdit.setPlainText(
+            self.format_summary(similarity, self.worker.text1, self.worker.text2).rstrip('\n')
+        )
+
+    def on_check_progress(self, done, total):
+        """Обновление индикатора прогресса"""
+        if self.sender() is not self.worker:
+            return
+
+        self.progressBar.setValue(done)
+
+    def on_fragments_found(self, matches):
+        """Потоковый вывод найденных фрагментов в подробности"""
+        if self.sender() is not self.worker:
+            return
+
+        if self.fragment_count == 0:
+            self.detailsTextEdit.append("\nНАЙДЕНЫ ПОХОЖИЕ ФРАГМЕНТЫ:\n" + "=" * 50)
+
+        for line_info in matches:
+            self.fragment_count += 1
+            self.detailsTextEdit.append(self.format_fragment(self.fragment_count, line_info).rstrip('\n'))
+
+    def on_check_finished(self, similarity, similar_lines):
+        """Проверка завершена полностью"""
+        if self.sender() is not self.worker:
+            return
+
+        if not similar_lines:
+            self.detailsTextEdit.append("\nПохожих фрагментов не найдено.")
+
+        self.detailsTextEdit.append(
+            f"\nКэш предобработки: попаданий {self.worker.cache_hits}, промахов {self.worker.cache_misses}"
+        )
+
+        self.progressBar.setVisible(False)
+        self.cancelButton.setEnabled(False)
 
         # Проверка порога срабатывания
         threshold = self.thresholdSpinBox.value()
         self.check_threshold(similarity, threshold)
 
-    def update_results(self, similarity, similar_lines, text1, text2):
-        """Обновление результатов проверки"""
-        # Общая схожесть
+    def on_worker_stopped(self):
+        """Освобождение завершившегося потока"""
+        worker = self.sender()
+        if worker in self.retired_workers:
+            self.retired_workers.remove(worker)
+        elif worker is self.worker:
+            self.worker = None
+            self.progressBar.setVisible(False)
+            self.cancelButton.setEnabled(False)
+        worker.deleteLater()
+
+    def closeEvent(self, event):
+        """Остановка фоновых потоков при закрытии окна"""
+        running = self.retired_workers + ([self.worker] if self.worker else [])
+        self.stop_worker()
+        for worker in running:
+            worker.cancel()
+            worker.wait()
+        self.corpus.close()
+        super().closeEvent(event)
+
+    def show_similarity(self, similarity):
+        """Отображение общей схожести с цветовой индикацией"""
         self.similarityLabel.setText(f"Схожесть: {similarity}%")
 
         # Цвет в зависимости от уровня схожести
@@ -143,24 +614,20 @@ class PlagiarismChecker(QtWidgets.QMainWindow):
 
         self.similarityLabel.setStyleSheet(f"font-size: 16px; font-weight: bold; color: {color};")
 
-        # Детальная информация
+    def format_summary(self, similarity, text1, text2):
+        """Заголовок подробной информации"""
         details = f"ОБЩАЯ СХОЖЕСТЬ: {similarity}%\n"
         details += f"Исходный текст: {len(text1.split())} слов, {len(text1)} символов\n"
         details += f"Проверяемый текст: {len(text2.split())} слов, {len(text2)} символов\n\n"
+        return details
 
-        if similar_lines:
-            details += "НАЙДЕНЫ ПОХОЖИЕ ФРАГМЕНТЫ:\n"
-            details += "=" * 50 + "\n"
-
-            for i, line_info in enumerate(similar_lines, 1):
-                details += f"\nФрагмент #{i} (схожесть: {line_info['similarity']}%):\n"
-                details += f"Исходный текст (строка {line_info['line1_num']}): {line_info['line1_text'][:100]}...\n"
-                details += f"Проверяемый текст (строка {line_info['line2_num']}): {line_info['line2_text'][:100]}...\n"
-                details += "-" * 30 + "\n"
-        else:
-            details += "Похожих фрагментов не найдено.\n"
-
-        self.detailsTextEdit.setPlainText(details)
+    def format_fragment(self, number, line_info):
+        """Описание одного найденного фрагмента"""
+        details = f"\nФрагмент #{number} (схожесть: {line_info['similarity']}%):\n"
+        details += f"Исходный текст (строка {line_info['line1_num']}): {line_info['line1_text'][:100]}...\n"
+        details += f"Проверяемый текст (строка {line_info['line2_num']}): {line_info['line2_text'][:100]}...\n"
+        details += "-" * 30 + "\n"
+        return details
 
     def check_threshold(self, similarity, threshold):
         """Проверка порога срабатывания и обновление статусной строки"""
@@ -173,20 +640,45 @@ class PlagiarismChecker(QtWidgets.QMainWindow):
 
     def update_text1_stats(self):
         """Обновление статистики первого текста"""
-        text = self.originalTextEdit.toPlainText()
-        char_count = len(text)
-        word_count = len(text.split())
-        self.text1StatsLabel.setText(f"Символов: {char_count}, Слов: {word_count}")
+        self.text1StatsLabel.setText(self.stats_text(1, self.text1_stats))
 
     def update_text2_stats(self):
         """Обновление статистики второго текста"""
-        text = self.checkedTextEdit.toPlainText()
-        char_count = len(text)
-        word_count = len(text.split())
-        self.text2StatsLabel.setText(f"Символов: {char_count}, Слов: {word_count}")
+        self.text2StatsLabel.setText(self.stats_text(2, self.text2_stats))
+
+    def stats_text(self, side, stats):
+        """Текст метки статистики поля"""
+        if side in self.loaded_files:
+            info = self.loaded_files[side]
+            return (f"Файл: {os.path.basename(info['path'])}, Символов: {info['char_count']}, "
+                    f"Слов: {info['word_count']} (показано начало)")
+        return f"Символов: {stats.char_count()}, Слов: {stats.word_count}"
+
+    def schedule_preview(self):
+        """Отложенный пересчет предварительной оценки"""
+        if self.livePreviewCheckBox.isChecked():
+            self.preview_timer.start()
+        else:
+            self.preview_timer.stop()
+
+    def update_preview(self):
+        """Предварительная схожесть по словам и биграммам без посимвольного сравнения"""
+        shingles1 = self.side_shingles(1)
+        shingles2 = self.side_shingles(2)
+
+        if not shingles1[0] or not shingles2[0]:
+            return
+
+        preview = plagiarism_core.shingles_similarity(shingles1, shingles2)
+        self.statusbar.setStyleSheet("")
+        self.statusbar.showMessage(f"Предварительная схожесть (по словам и биграммам): {preview}%")
 
     def clear_all(self):
         """Очистка всех полей"""
+        self.stop_worker()
+        self.loaded_files.clear()
+        self.originalTextEdit.setReadOnly(False)
+        self.checkedTextEdit.setReadOnly(False)
         self.originalTextEdit.clear()
         self.checkedTextEdit.clear()
         self.detailsTextEdit.clear()
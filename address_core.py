@@ -0,0 +1,82 @@
+import re
+import unicodedata
+from bisect import bisect_left
+from operator import attrgetter
+
+
+contact_name_key = attrgetter('name_key')
+
+NOT_DIGITS = re.compile('[^0-9]')
+
+# Символ больше любого другого: префикс p покрывает ключи от p до p + MAX_CHAR
+MAX_CHAR = '\U0010ffff'
+
+
+def name_key(name):
+    """Ключ имени для сравнения и сортировки без учета регистра.
+
+    casefold сравнивает регистр полнее, чем lower ('ß' и 'SS'), а NFC
+    сводит к одному виду буквы, набранные разными последовательностями
+    кодов ('й' одним символом и 'и' с комбинируемой краткой).
+    """
+    return unicodedata.normalize('NFC', name).casefold()
+
+
+def phone_key(phone):
+    """Только цифры номера: '+7 (900) 123-45-67' -> '79001234567'"""
+    return NOT_DIGITS.sub('', phone)
+
+
+def contact_phone_key(contact):
+    """Порядок контактов при поиске по номеру"""
+    return phone_key(contact.phone), contact.name_key
+
+
+def parse_query(text):
+    """Разбор строки поиска.
+
+    Возвращает ('phone', цифры), если в строке есть цифры и нет букв,
+    иначе ('name', ключ имени). Пустая строка - ('name', ''), то есть
+    все контакты.
+    """
+    text = text.strip()
+    digits = phone_key(text)
+    if digits and not any(char.isalpha() for char in text):
+        return 'phone', digits
+    return 'name', name_key(text)
+
+
+def matches_query(contact, mode, prefix):
+    """Подходит ли контакт под разобранную строку поиска"""
+    if mode == 'phone':
+        return phone_key(contact.phone).startswith(prefix)
+    return contact.name_key.startswith(prefix)
+
+
+class Contact:
+    """Контакт адресной книги: имя и телефон.
+
+    name_key хранится вместе с именем, чтобы не пересчитывать его при
+    каждом сравнении; contact_id - ключ записи в хранилище (None, пока
+    контакт не сохранен).
+    """
+
+    __slots__ = ('name', 'phone', 'name_key', 'contact_id')
+
+    def __init__(self, name, phone, contact_id=None):
+        self.name = name
+        self.phone = phone
+        self.name_key = name_key(name)
+        self.contact_id = contact_id
+
+    def __repr__(self):
+        return f"Contact({self.name!r}, {self.phone!r}, {self.contact_id!r})"
+
+    def display_text(self):
+        """Строка контакта для списка"""
+        return f"{self.name} - {self.phone}"
+
+
+def insert_position(contacts, key, sort_key=contact_name_key):
+    """Позиция для вставки в список контактов, отсортированный по sort_key"""
+    return bisect_left(contacts, key, key=sort_key)
@@ -0,0 +1,169 @@
+import csv
+import os
+import quopri
+import re
+
+from address_core import Contact
+
+
+# Экранирование текста в vCard (RFC 6350, 3.4)
+VCARD_ESCAPED = re.compile(r'\\(.)')
+VCARD_UNESCAPE = {'n': ' ', 'N': ' '}
+
+# Заголовки столбцов CSV с именем и телефоном (в нижнем регистре)
+CSV_NAME_HEADERS = ('name', 'имя', 'фио', 'full name', 'display name')
+CSV_PHONE_HEADERS = ('phone', 'телефон', 'tel', 'mobile', 'phone 1 - value')
+
+
+def unescape_vcard_text(text):
+    """Текст vCard без экранирования; переносы строк заменяются пробелами"""
+    return VCARD_ESCAPED.sub(lambda match: VCARD_UNESCAPE.get(match.group(1), match.group(1)), text)
+
+
+def split_vcard_components(value):
+    """Компоненты структурного значения vCard (N): разделитель - неэкранированная ';'"""
+    parts = ['']
+    escaped = False
+    for char in value:
+        if escaped:
+            parts[-1] += char
+            escaped = False
+        elif char == '\\':
+            # Экранирование снимает decode_vcard_value, здесь оно сохраняется
+            parts[-1] += char
+            escaped = True
+        elif char == ';':
+            parts.append('')
+        else:
+            parts[-1] += char
+    return parts
+
+
+def unfold_vcard_lines(lines):
+    """Склейка перенесенных строк vCard.
+
+    Продолжение строки начинается с пробела (vCard 3.0 и 4.0), а в
+    quoted-printable (vCard 2.1) строка, оканчивающаяся на '=',
+    продолжается следующей.
+    """
+    current = None
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if current is not None:
+            if line[:1] in (' ', '\t'):
+                current += line[1:]
+                continue
+            if current.endswith('=') and 'QUOTED-PRINTABLE' in current.split(':', 1)[0].upper():
+                current = current[:-1] + line
+                continue
+            yield current
+        current = line
+    if current is not None:
+        yield current
+
+
+def decode_vcard_value(value, params):
+    """Значение свойства vCard с учетом ENCODING=QUOTED-PRINTABLE и CHARSET"""
+    if 'ENCODING=QUOTED-PRINTABLE' not in params and 'QUOTED-PRINTABLE' not in params:
+        return unescape_vcard_text(value)
+
+    charset = 'utf-8'
+    for param in params:
+        if param.startswith('CHARSET='):
+            charset = param[len('CHARSET='):].lower()
+    data = quopri.decodestring(value.encode('ascii', 'replace'))
+    try:
+        return data.decode(charset, 'replace')
+    except LookupError:
+        return data.decode('utf-8', 'replace')
+
+
+class ContactFileReader:
+    """Потоковое чтение контактов из файла vCard (.vcf) или CSV.
+
+    Файл читается построчно, контакты выдаются по одному, поэтому память
+    не зависит от размера файла. Записи без имени или телефона
+    пропускаются и подсчитываются в errors.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.size = os.path.getsize(path)
+        self.errors = 0
+        self.file = None
+
+    @property
+    def bytes_read(self):
+        if self.file is None or self.file.closed:
+            return self.size
+        return self.file.buffer.tell()
+
+    def __iter__(self):
+        is_vcard = self.path.lower().endswith(('.vcf', '.vcard'))
+        with open(self.path, encoding='utf-8-sig', errors='replace', newline='') as self.file:
+            yield from self.read_vcard() if is_vcard else self.read_csv()
+
+    def make_contact(self, name, phone):
+        """Контакт из прочитанных полей или None (запись считается ошибкой)"""
+        name = ' '.join(name.split())
+        phone = phone.strip()
+        if not name or not phone:
+            self.errors += 1
+            return None
+        return Contact(name, phone)
+
+    def read_vcard(self):
+        full_name = None
+        structured_name = None
+        phone = None
+        in_card = False
+
+        for line in unfold_vcard_lines(self.file):
+            prop, _, value = line.partition(':')
+            prop_name, *params = prop.split(';')
+            # Группа свойства (item1.TEL) не важна
+            prop_name = prop_name.rsplit('.', 1)[-1].upper()
+            params = [param.upper() for param in params]
+
+            if prop_name == 'BEGIN' and value.upper() == 'VCARD':
+                in_card = True
+                full_name = structured_name = phone = None
+            elif not in_card:
+                continue
+            elif prop_name == 'END' and value.upper() == 'VCARD':
+                in_card = False
+                contact = self.make_contact(full_name or structured_name or '', phone or '')
+                if contact is not None:
+                    yield contact
+            elif prop_name == 'FN':
+                full_name = decode_vcard_value(value, params)
+            elif prop_name == 'N' and structured_name is None:
+                # Фамилия;Имя;Отчество;... -> "Имя Отчество Фамилия"
+                parts = [decode_vcard_value(part, params) for part in split_vcard_components(value)]
+                structured_name = ' '.join(parts[1:3] + parts[:1])
+            elif prop_name == 'TEL' and phone is None:
+                phone = decode_vcard_value(value, params)
+
+    def read_csv(self):
+        rows = csv.reader(self.file)
+        name_column, phone_column = 0, 1
+
+        for number, row in enumerate(rows):
+            if not row or not any(cell.strip() for cell in row):
+                continue
+
+            if number == 0:
+                headers = [cell.strip().lower() for cell in row]
+                if any(header in CSV_NAME_HEADERS for header in headers):
+                    name_column = next(i for i, header in enumerate(headers) if header in CSV_NAME_HEADERS)
+                    phone_column = next(
+                        (i for i, header in enumerate(headers) if header in CSV_PHONE_HEADERS), 1
+                    )
+                    continue
+
+            if len(row) <= max(name_column, phone_column):
+                self.errors += 1
+                continue
+            contact = self.make_contact(row[name_column], row[phone_column])
+            if contact is not None:
+                yield contact
@@ -0,0 +1,153 @@
+import sqlite3
+
+from address_core import MAX_CHAR, Contact, name_key, phone_key
+
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS contacts (
+    contact_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    phone TEXT NOT NULL,
+    phone_digits TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS contacts_name_key ON contacts (name_key);
+CREATE INDEX IF NOT EXISTS contacts_phone_digits ON contacts (phone_digits, name_key);
+'''
+
+
+class ContactStore:
+    """Контакты адресной книги в файле SQLite.
+
+    Уникальный индекс по ключу имени (name_key: без учета регистра)
+    одновременно упорядочивает контакты и отвечает на проверку дубликатов
+    за O(log n) без обхода всей книги, а новые контакты встают в
+    B-дерево индекса без пересортировки. Второй индекс - по цифрам
+    номера (phone_digits). Поиск по началу имени или номера - это
+    диапазон ключей в индексе, так что страница результатов читается
+    за O(log n) независимо от размера книги.
+    Журнал WAL делает каждую фиксацию атомарной, а контакты читаются
+    страницами по индексу.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+
+    def __len__(self):
+        return self.connection.execute('SELECT COUNT(*) FROM contacts').fetchone()[0]
+
+    def find(self, name):
+        """Контакт с таким же именем без учета регистра или None"""
+        row = self.connection.execute(
+            'SELECT name, phone, contact_id FROM contacts WHERE name_key = ?', (name_key(name),)
+        ).fetchone()
+        return Contact(*row) if row else None
+
+    def insert(self, contact):
+        """Запись контакта; False, если имя уже занято"""
+        cursor = self.connection.execute(
+            'INSERT INTO contacts (name, name_key, phone, phone_digits) VALUES (?, ?, ?, ?) '
+            'ON CONFLICT (name_key) DO NOTHING',
+            (contact.name, contact.name_key, contact.phone, phone_key(contact.phone))
+        )
+        if not cursor.rowcount:
+            return False
+
+        contact.contact_id = cursor.lastrowid
+        return True
+
+    def add_contact(self, contact, commit=True):
+        """Сохранение нового контакта; contact.contact_id получает ключ записи.
+
+        При серии изменений передайте commit=False и вызовите commit()
+        после пачки.
+        """
+        if not self.insert(contact):
+            raise ValueError(f"Контакт с именем {contact.name!r} уже существует")
+
+        if commit:
+            self.commit()
+
+    def add_contacts(self, contacts, commit=True):
+        """Сохранение пачки контактов за один проход.
+
+        Дубликат - контакт, имя которого уже есть в книге или раньше
+        встретилось в этой же пачке; такие контакты не сохраняются.
+        Возвращает (добавленные, дубликаты).
+        """
+        added = []
+        duplicates = []
+        seen = set()
+        for contact in contacts:
+            if contact.name_key in seen:
+                duplicates.append(contact)
+                continue
+            seen.add(contact.name_key)
+
+            # Имя, уже занятое в книге, отсекает уникальный индекс
+            if self.insert(contact):
+                added.append(contact)
+            else:
+                duplicates.append(contact)
+
+        if commit:
+            self.commit()
+        return added, duplicates
+
+    def remove_contact(self, contact, commit=True):
+        """Удаление контакта"""
+        self.connection.execute('DELETE FROM contacts WHERE contact_id = ?', (contact.contact_id,))
+
+        if commit:
+            self.commit()
+
+    def clear(self, commit=True):
+        """Удаление всех контактов"""
+        self.connection.execute('DELETE FROM contacts')
+
+        if commit:
+            self.commit()
+
+    def commit(self):
+        """Сохранение накопленных изменений на диск"""
+        self.connection.commit()
+
+    def close(self):
+        self.connection.commit()
+        self.connection.close()
+
+    def contacts_after(self, contact=None, limit=500, mode='name', prefix=''):
+        """Следующая страница контактов после contact (с начала, если None).
+
+        mode и prefix - разобранная строка поиска (address_core.parse_query):
+        при mode='name' контакты с началом имени prefix по алфавиту, при
+        mode='phone' - с началом номера prefix по номеру.
+        """
+        if mode == 'phone':
+            key_columns = '(phone_digits, name_key)'
+            range_column = 'phone_digits'
+            after = (phone_key(contact.phone), contact.name_key) if contact else None
+        else:
+            key_columns = 'name_key'
+            range_column = 'name_key'
+            after = (contact.name_key,) if contact else None
+
+        conditions = []
+        parameters = []
+        if prefix:
+            conditions.append(f'{range_column} >= ? AND {range_column} < ?')
+            parameters += [prefix, prefix + MAX_CHAR]
+        if after is not None:
+            conditions.append(f'{key_columns} > ({", ".join("?" * len(after))})')
+            parameters += after
+
+        where = f'WHERE {" AND ".join(conditions)} ' if conditions else ''
+        rows = self.connection.execute(
+            f'SELECT name, phone, contact_id FROM contacts {where}ORDER BY {key_columns.strip("()")} LIMIT ?',
+            parameters + [limit]
+        )
+        return [Contact(*row) for row in rows]
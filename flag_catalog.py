@@ -0,0 +1,116 @@
+import argparse
+import itertools
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from PyQt5.QtCore import QPoint
+from PyQt5.QtGui import QImage, QPainter
+
+from flag_render import COLOR_NAMES, flag_size, render_flag
+
+
+# Сколько рядов листа рисует процесс за одно задание
+BAND_ROWS = 8
+
+
+def flag_combinations(stripe_counts):
+    """Все флаги из цветов COLOR_NAMES: для каждого числа полос - все сочетания"""
+    for count in stripe_counts:
+        yield from itertools.product(COLOR_NAMES, repeat=count)
+
+
+def render_band(task):
+    """Полоса листа из нескольких рядов флагов в процессе пула.
+
+    Возвращает пиксели полосы в формате QImage.Format_RGB32: QImage между
+    процессами не передается.
+    """
+    flags, columns, tile_width, tile_height = task
+    rows = math.ceil(len(flags) / columns)
+    band = QImage(columns * tile_width, rows * tile_height, QImage.Format_RGB32)
+    band.fill(0xffffffff)
+
+    painter = QPainter(band)
+    for number, colors in enumerate(flags):
+        row, column = divmod(number, columns)
+        painter.drawImage(QPoint(column * tile_width, row * tile_height),
+                          render_flag(colors, tile_width, tile_height))
+    painter.end()
+    return band.width(), band.height(), band.constBits().asstring(band.sizeInBytes())
+
+
+def render_catalog(flags, columns, tile_width, tile_height, workers):
+    """Лист со всеми флагами: процессы рисуют полосы по BAND_ROWS рядов"""
+    rows = math.ceil(len(flags) / columns)
+    sheet = QImage(columns * tile_width, rows * tile_height, QImage.Format_RGB32)
+    sheet.fill(0xffffffff)
+
+    band_size = BAND_ROWS * columns
+    tasks = [
+        (flags[start:start + band_size], columns, tile_width, tile_height)
+        for start in range(0, len(flags), band_size)
+    ]
+
+    painter = QPainter(sheet)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for number, (width, height, data) in enumerate(executor.map(render_band, tasks)):
+            band = QImage(data, width, height, QImage.Format_RGB32)
+            painter.drawImage(QPoint(0, number * BAND_ROWS * tile_height), band)
+    painter.end()
+    return sheet
+
+
+def catalog_index(flags, columns, tile_width, tile_height, sheet_name):
+    """Оглавление листа: где лежит каждый флаг"""
+    entries = []
+    for number, colors in enumerate(flags):
+        row, column = divmod(number, columns)
+        entries.append({
+            'colors': list(colors),
+            'names': [COLOR_NAMES[color] for color in colors],
+            'x': column * tile_width,
+            'y': row * tile_height,
+        })
+    return {
+        'sheet': sheet_name,
+        'tile_width': tile_width,
+        'tile_height': tile_height,
+        'columns': columns,
+        'flags': entries,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Каталог всех флагов-триколоров в одном листе PNG")
+    parser.add_argument('--stripes', type=int, nargs='+', default=[3], help="число полос (можно несколько)")
+    parser.add_argument('--width', type=int, default=60, help="ширина одного флага в пикселях")
+    parser.add_argument('--columns', type=int, help="флагов в ряду листа (по умолчанию лист близок к квадрату)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="число процессов")
+    parser.add_argument('--output', default='flags.png', help="файл листа; оглавление - рядом, с расширением .json")
+    args = parser.parse_args()
+
+    flags = list(flag_combinations(args.stripes))
+    tile_width, tile_height = flag_size(args.width)
+    columns = args.columns or math.ceil(math.sqrt(len(flags) * tile_height / tile_width))
+
+    started = time.perf_counter()
+    sheet = render_catalog(flags, columns, tile_width, tile_height, args.workers)
+    rendered = time.perf_counter() - started
+    if not sheet.save(args.output, 'PNG'):
+        parser.error(f"не удалось сохранить {args.output}")
+
+    index_path = os.path.splitext(args.output)[0] + '.json'
+    with open(index_path, 'w', encoding='utf-8') as file:
+        json.dump(catalog_index(flags, columns, tile_width, tile_height, os.path.basename(args.output)),
+                  file, ensure_ascii=False, indent=1)
+    total = time.perf_counter() - started
+
+    print(f"Флагов: {len(flags)}, лист {sheet.width()}x{sheet.height()} -> {args.output}, {index_path}")
+    print(f"Рисование: {len(flags) / rendered:,.0f} флагов/с, с сохранением: {len(flags) / total:,.0f} флагов/с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+from collections import OrderedDict
+
+from PyQt5.QtCore import QRect
+from PyQt5.QtGui import QColor, QImage, QPainter, QPixmap
+
+
+# Цвета полос по имени из objectName кнопок (top_red -> red)
+FLAG_COLORS = {
+    'red': '#d52b1e',
+    'blue': '#0039a6',
+    'green': '#009246',
+    'yellow': '#fcd116',
+    'white': '#ffffff',
+}
+
+# Названия цветов для пользователя
+COLOR_NAMES = {
+    'red': 'Красный',
+    'blue': 'Синий',
+    'green': 'Зеленый',
+    'yellow': 'Желтый',
+    'white': 'Белый',
+}
+
+# Флаг 3:2 - ширина к высоте
+FLAG_RATIO = 3 / 2
+
+# Рамка, чтобы белая полоса была видна на светлом фоне
+BORDER_COLOR = '#7f8c8d'
+
+
+def flag_size(width):
+    """Размер флага (ширина, высота) по ширине"""
+    return width, max(1, round(width / FLAG_RATIO))
+
+
+def stripe_bounds(count, height):
+    """Верхняя и нижняя граница каждой из count полос; высоты отличаются не больше чем на пиксель"""
+    edges = [round(height * index / count) for index in range(count + 1)]
+    return list(zip(edges, edges[1:]))
+
+
+def render_flag(colors, width, height):
+    """Флаг из горизонтальных полос colors (сверху вниз) в QImage.
+
+    QImage рисуется без окна и без QApplication с экраном, поэтому
+    функцию можно вызывать в фоновых потоках и процессах.
+    """
+    image = QImage(width, height, QImage.Format_RGB32)
+    painter = QPainter(image)
+    for color, (top, bottom) in zip(colors, stripe_bounds(len(colors), height)):
+        painter.fillRect(QRect(0, top, width, bottom - top), QColor(FLAG_COLORS[color]))
+    painter.setPen(QColor(BORDER_COLOR))
+    painter.drawRect(0, 0, width - 1, height - 1)
+    painter.end()
+    return image
+
+
+def flag_svg(colors, width, height):
+    """Флаг в формате SVG: векторный, одинаково четкий при любом размере"""
+    count = len(colors)
+    stripes = ''.join(
+        f'<rect x="0" y="{index}" width="{count * FLAG_RATIO:g}" height="1" fill="{FLAG_COLORS[color]}"/>'
+        for index, color in enumerate(colors)
+    )
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'viewBox="0 0 {count * FLAG_RATIO:g} {count}" preserveAspectRatio="none">'
+        f'{stripes}'
+        f'<rect x="0" y="0" width="{count * FLAG_RATIO:g}" height="{count}" fill="none" '
+        f'stroke="{BORDER_COLOR}" stroke-width="1" vector-effect="non-scaling-stroke"/>'
+        f'</svg>\n'
+    )
+
+
+class FlagCache:
+    """LRU-кеш нарисованных флагов: ключ - (верх, середина, низ, размер).
+
+    Повторный выбор уже виденного сочетания цветов не рисует флаг заново.
+    Кеш ограничен по памяти: когда картинки занимают больше max_bytes,
+    удаляются давно не показанные.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.pixmaps = OrderedDict()
+        self.bytes = 0
+
+    def __len__(self):
+        return len(self.pixmaps)
+
+    def find(self, colors, size):
+        """Флаг из кеша или None, если такого нет"""
+        key = (*colors, size)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(key)
+        return pixmap
+
+    def pixmap(self, colors, size):
+        """Флаг размера size (ширина, высота) - из кеша или нарисованный"""
+        pixmap = self.find(colors, size)
+        if pixmap is not None:
+            return pixmap
+
+        pixmap = QPixmap.fromImage(render_flag(colors, *size))
+        self.pixmaps[(*colors, size)] = pixmap
+        self.bytes += size[0] * size[1] * 4
+        while self.bytes > self.max_bytes and len(self.pixmaps) > 1:
+            (*_, (width, height)), _ = self.pixmaps.popitem(last=False)
+            self.bytes -= width * height * 4
+        return pixmap
@@ -0,0 +1,121 @@
+import argparse
+import csv
+import functools
+import itertools
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from plagiarism_core import SEQUENCE_BACKENDS, calculate_similarity, find_similar_lines
+from plagiarism_files import read_text_file
+
+
+FIELDS = ['file1', 'file2', 'overall_similarity',
+          'line1_num', 'line1_text', 'line2_num', 'line2_text', 'similarity', 'error']
+
+
+def read_text(path):
+    """Чтение документа так же, как его видит окно проверки"""
+    return read_text_file(path).strip()
+
+
+def compare_files(pair, sequence='chars', threshold=0.0):
+    """Сравнение пары файлов: строки результата в формате FIELDS.
+
+    Если файл не читается, пара дает одну строку с текстом ошибки в поле
+    error, а остальные пары проверяются дальше.
+    """
+    path1, path2 = pair
+    row = dict.fromkeys(FIELDS)
+    row.update(file1=path1, file2=path2)
+    try:
+        text1 = read_text(path1)
+        text2 = read_text(path2)
+    except OSError as error:
+        return [dict(row, error=str(error))]
+
+    row['overall_similarity'] = calculate_similarity(text1, text2, sequence, threshold)
+
+    similar_lines = find_similar_lines(text1, text2) if text1 and text2 else []
+    if not similar_lines:
+        return [row]
+
+    return [dict(row, **line_info) for line_info in similar_lines]
+
+
+def directory_pairs(directory):
+    """Все пары .txt файлов папки"""
+    paths = sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.lower().endswith('.txt')
+    )
+    return itertools.combinations(paths, 2)
+
+
+def list_pairs(pairs_file):
+    """Пары из файла: два пути в строке через табуляцию или запятую"""
+    with open(pairs_file, encoding='utf-8', newline='') as file:
+        dialect = 'excel-tab' if '\t' in file.readline() else 'excel'
+        file.seek(0)
+        for row in csv.reader(file, dialect):
+            if len(row) >= 2 and row[0].strip():
+                yield row[0].strip(), row[1].strip()
+
+
+def report_errors(rows, failed_pairs):
+    """Строки результата без изменений; ошибки чтения пар - в stderr и в failed_pairs"""
+    for row in rows:
+        if row['error'] is not None:
+            failed_pairs.append((row['file1'], row['file2']))
+            print(f"{row['file1']}, {row['file2']}: {row['error']}", file=sys.stderr)
+        yield row
+
+
+def write_results(rows, output, output_format):
+    """Потоковая запись строк результата в JSONL или CSV"""
+    if output_format == 'csv':
+        writer = csv.DictWriter(output, fieldnames=FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+    else:
+        for row in rows:
+            output.write(json.dumps(row, ensure_ascii=False) + '\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Пакетная проверка документов на плагиат")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('directory', nargs='?', help="папка с .txt файлами (сравниваются все пары)")
+    source.add_argument('--pairs', help="файл со списком пар путей")
+    parser.add_argument('--format', choices=['jsonl', 'csv'], default='jsonl', help="формат результата")
+    parser.add_argument('--output', help="файл результата (по умолчанию stdout)")
+    parser.add_argument('--sequence', choices=sorted(SEQUENCE_BACKENDS), default='chars',
+                        help="способ последовательного сравнения (см. plagiarism_core)")
+    parser.add_argument('--threshold', type=float, default=0.0,
+                        help="порог в процентах для способа bounded")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="число процессов")
+    args = parser.parse_args()
+
+    pairs = list_pairs(args.pairs) if args.pairs else directory_pairs(args.directory)
+
+    failed_pairs = []
+    output = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            compare = functools.partial(compare_files, sequence=args.sequence, threshold=args.threshold)
+            results = executor.map(compare, pairs, chunksize=4)
+            rows = report_errors(itertools.chain.from_iterable(results), failed_pairs)
+            write_results(rows, output, args.format)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    if failed_pairs:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,369 @@
+import hashlib
+import re
+import sys
+import threading
+from collections import Counter, OrderedDict, defaultdict
+from difflib import SequenceMatcher
+
+
+def preprocess_text(text):
+    """Предобработка текста: приведение к нижнему регистру и удаление лишних символов"""
+    text = text.lower()
+    text = re.sub(r'[^\w\s]', '', text)  # Удаляем пунктуацию
+    text = re.sub(r'\s+', ' ', text)  # Заменяем множественные пробелы на один
+    return text.strip()
+
+
+def get_ngrams(text, n=2):
+    """Список n-грамм из слов предобработанного текста"""
+    words = text.split()
+    return [' '.join(words[i:i + n]) for i in range(len(words) - n + 1)]
+
+
+class ShingleCache:
+    """LRU-кэш предобработки: текст -> (предобработанный текст, слова, биграммы).
+
+    Ключ - хеш текста, поэтому сами тексты кэш не удерживает. Размер
+    ограничен примерной занимаемой памятью; тексты крупнее лимита не
+    кэшируются. Возвращаемые множества общие - изменять их нельзя.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        # Счетчики попаданий и промахов - свои у каждого потока, чтобы
+        # одновременные проверки не смешивались
+        self.local = threading.local()
+        self.lock = threading.Lock()
+
+    def get(self, text):
+        """Предобработанный текст, слова и биграммы (из кэша или посчитанные)"""
+        key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.local.hits = getattr(self.local, 'hits', 0) + 1
+                return entry[:3]
+            self.local.misses = getattr(self.local, 'misses', 0) + 1
+
+        processed = preprocess_text(text)
+        words, bigrams = tokens_shingles(processed)
+        size = (sys.getsizeof(processed) + sys.getsizeof(words) + sys.getsizeof(bigrams)
+                + sum(map(sys.getsizeof, words)) + sum(map(sys.getsizeof, bigrams)))
+
+        if size <= self.max_bytes:
+            with self.lock:
+                if key not in self.entries:
+                    self.entries[key] = (processed, words, bigrams, size)
+                    self.size += size
+                while self.size > self.max_bytes:
+                    _, evicted = self.entries.popitem(last=False)
+                    self.size -= evicted[3]
+
+        return processed, words, bigrams
+
+    def thread_stats(self):
+        """Счетчики попаданий и промахов текущего потока"""
+        return getattr(self.local, 'hits', 0), getattr(self.local, 'misses', 0)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+
+# Общий кэш предобработки для всех проверок процесса
+shingle_cache = ShingleCache()
+
+
+def text_shingles(text):
+    """Множества слов и биграмм текста (как в calculate_similarity)"""
+    _, words, bigrams = shingle_cache.get(text)
+    return words, bigrams
+
+
+def tokens_shingles(processed):
+    """Множества слов и биграмм уже предобработанного текста"""
+    return set(processed.split()), set(get_ngrams(processed, 2))
+
+
+def chars_ratio(text1, text2, min_ratio=0.0):
+    """Посимвольный SequenceMatcher по исходным текстам (как было всегда).
+
+    Близок к квадратичному по длине и с autojunk на текстах длиннее 200
+    символов игнорирует частые буквы, поэтому на больших текстах медленный
+    и не вполне точный.
+    """
+    return SequenceMatcher(None, text1, text2).ratio()
+
+
+def tokens_ratio(text1, text2, min_ratio=0.0):
+    """SequenceMatcher по словам предобработанных текстов без autojunk.
+
+    Элементов в 5-7 раз меньше, чем символов, поэтому на текстах в сотни
+    килобайт работает в десятки раз быстрее посимвольного сравнения. На
+    несвязанных текстах итог почти совпадает с 'chars'; на длинных почти
+    дубликатах он выше, потому что autojunk не выбрасывает частые символы
+    и совпадения не теряются.
+    """
+    words1 = shingle_cache.get(text1)[0].split()
+    words2 = shingle_cache.get(text2)[0].split()
+    return SequenceMatcher(None, words1, words2, autojunk=False).ratio()
+
+
+def bounded_ratio(text1, text2, min_ratio=0.0):
+    """Посимвольный SequenceMatcher с отсечением по порогу.
+
+    Сначала считаются верхние оценки real_quick_ratio (по длинам) и
+    quick_ratio (по составу символов); если оценка уже ниже min_ratio,
+    возвращается она. Итог по порогу совпадает с chars_ratio, а при
+    результате выше порога совпадает и сама оценка; ниже порога
+    показывается завышенная, но все равно не проходящая порог величина.
+    """
+    matcher = SequenceMatcher(None, text1, text2)
+    for estimate in (matcher.real_quick_ratio, matcher.quick_ratio):
+        bound = estimate()
+        if bound < min_ratio:
+            return bound
+    return matcher.ratio()
+
+
+# Способы последовательного сравнения (метод 2), выбираются на каждую проверку
+SEQUENCE_BACKENDS = {
+    'chars': chars_ratio,
+    'tokens': tokens_ratio,
+    'bounded': bounded_ratio,
+}
+
+
+def calculate_similarity(text1, text2, sequence='chars', threshold=0.0):
+    """Расчет схожести текстов с использованием нескольких методов"""
+    if not text1 or not text2:
+        return 0.0
+
+    return similarity_from_shingles(text1, text_shingles(text1), text2, text_shingles(text2), sequence, threshold)
+
+
+def similarity_from_shingles(text1, shingles1, text2, shingles2, sequence='chars', threshold=0.0):
+    """Расчет схожести по исходным текстам и заранее посчитанным text_shingles.
+
+    sequence - ключ SEQUENCE_BACKENDS; threshold (в процентах) нужен только
+    способу 'bounded', чтобы не считать точное сравнение там, где итог
+    порог все равно не пройдет.
+    """
+    # Метод 1: Сравнение по словам (Jaccard similarity)
+    words1, ngrams1 = shingles1
+    words2, ngrams2 = shingles2
+
+    if not words1 or not words2:
+        return 0.0
+
+    intersection = words1.intersection(words2)
+    union = words1.union(words2)
+    jaccard_similarity = len(intersection) / len(union) * 100
+
+    # Метод 3: Сравнение по n-граммам (биграммы)
+    if ngrams1 and ngrams2:
+        ngram_similarity = len(ngrams1.intersection(ngrams2)) / len(ngrams1.union(ngrams2)) * 100
+    else:
+        ngram_similarity = 0.0
+
+    # Метод 2: Последовательное сравнение. Запас 0.005 - чтобы округленный
+    # итог при отсечении гарантированно остался ниже порога
+    min_ratio = (threshold - 0.005 - jaccard_similarity * 0.4 - ngram_similarity * 0.3) / 0.3 / 100
+    seq_similarity = SEQUENCE_BACKENDS[sequence](text1, text2, min_ratio) * 100
+
+    # Взвешенное среднее всех методов
+    similarity = (jaccard_similarity * 0.4 + seq_similarity * 0.3 + ngram_similarity * 0.3)
+
+    return round(similarity, 2)
+
+
+def shingles_similarity(shingles1, shingles2):
+    """Схожесть только по словам и биграммам (методы 1 и 3 без SequenceMatcher).
+
+    Веса те же, что в calculate_similarity, но нормированы на 0.7, чтобы
+    шкала была от 0 до 100. Нужна там, где самих текстов под рукой нет.
+    """
+    words1, ngrams1 = shingles1
+    words2, ngrams2 = shingles2
+
+    if not words1 or not words2:
+        return 0.0
+
+    jaccard_similarity = len(words1 & words2) / len(words1 | words2) * 100
+    if ngrams1 and ngrams2:
+        ngram_similarity = len(ngrams1 & ngrams2) / len(ngrams1 | ngrams2) * 100
+    else:
+        ngram_similarity = 0.0
+
+    return round((jaccard_similarity * 0.4 + ngram_similarity * 0.3) / 0.7, 2)
+
+
+def shingle_prefix(words, bigrams, frequency):
+    """Префикс строки для отбора кандидатов на схожесть выше 50%.
+
+    Даже при полном совпадении по SequenceMatcher порог 50% требует
+    0.4 * (доля общих слов) + 0.3 * (доля общих биграмм) > 0.2, где доли
+    берутся от размеров множеств этой строки. Каждому слову и биграмме
+    назначается вес в этой сумме; префикс набирается от редких элементов
+    к частым, пока вес остатка не станет меньше 0.2. Две строки, чьи
+    префиксы не пересекаются, порог пройти не могут.
+
+    Для каждого элемента префикса возвращается (элемент, это слово,
+    слов после него, биграмм после него) - для позиционного фильтра.
+    """
+    if not words:
+        return []
+
+    tokens = [(word, True) for word in words] + [(bigram, False) for bigram in bigrams]
+    tokens.sort(key=lambda token: (frequency[token[0]], token[0]))
+
+    remaining = 0.4 + (0.3 if bigrams else 0.0)
+    words_left = len(words)
+    bigrams_left = len(bigrams)
+
+    prefix = []
+    for token, is_word in tokens:
+        if remaining < 0.2 - 1e-9:
+            break
+        if is_word:
+            words_left -= 1
+            remaining -= 0.4 / len(words)
+        else:
+            bigrams_left -= 1
+            remaining -= 0.3 / len(bigrams)
+        prefix.append((token, is_word, words_left, bigrams_left))
+    return prefix
+
+
+def blend_line_similarity(shingles1, shingles2, common_words, common_bigrams, seq_similarity):
+    """Итоговая схожесть строк по числу общих слов и биграмм (как в calculate_similarity)"""
+    words1, bigrams1 = shingles1
+    words2, bigrams2 = shingles2
+
+    jaccard_similarity = common_words / (len(words1) + len(words2) - common_words) * 100
+    if bigrams1 and bigrams2:
+        ngram_similarity = common_bigrams / (len(bigrams1) + len(bigrams2) - common_bigrams) * 100
+    else:
+        ngram_similarity = 0.0
+
+    return round(jaccard_similarity * 0.4 + seq_similarity * 0.3 + ngram_similarity * 0.3, 2)
+
+
+def bound_line_similarity(size1, size2, common_words, common_bigrams):
+    """Верхняя оценка схожести строк по размерам (слов, биграмм, символов)
+    и верхним оценкам числа общих слов и биграмм"""
+    words1, bigrams1, length1 = size1
+    words2, bigrams2, length2 = size2
+
+    jaccard_similarity = common_words / (words1 + words2 - common_words) * 100
+    if bigrams1 and bigrams2:
+        ngram_similarity = common_bigrams / (bigrams1 + bigrams2 - common_bigrams) * 100
+    else:
+        ngram_similarity = 0.0
+    # real_quick_ratio: совпасть может не больше символов, чем в более короткой строке
+    seq_similarity = 2.0 * min(length1, length2) / (length1 + length2) * 100
+
+    return round(jaccard_similarity * 0.4 + seq_similarity * 0.3 + ngram_similarity * 0.3, 2)
+
+
+def iter_similar_lines(text1, text2):
+    """Поиск похожих строк по одной строке исходного текста за раз.
+
+    Выдает пары (номер строки text1, найденные для нее фрагменты),
+    чтобы фоновая проверка могла показывать прогресс и прерываться.
+    Полный расчет схожести выполняется только для пар строк, которые
+    по индексу и верхним оценкам могут пройти порог 50%.
+    """
+    lines1 = text1.split('\n')
+    lines2 = text2.split('\n')
+
+    # Каждая строка предобрабатывается один раз
+    shingles1 = [text_shingles(line) for line in lines1]
+    shingles2 = [text_shingles(line) for line in lines2]
+
+    # Слова и биграммы упорядочиваются от редких к частым - так префиксы
+    # строк состоят из самых избирательных элементов
+    frequency = Counter()
+    for words, bigrams in shingles1 + shingles2:
+        frequency.update(words)
+        frequency.update(bigrams)
+
+    # Инвертированный индекс по префиксам строк text2
+    prefix_index = defaultdict(list)
+    for j, (words, bigrams) in enumerate(shingles2, 1):
+        for token, _, words_left, bigrams_left in shingle_prefix(words, bigrams, frequency):
+            prefix_index[token].append((j, words_left, bigrams_left))
+
+    sizes2 = [(len(words), len(bigrams), len(line)) for line, (words, bigrams) in zip(lines2, shingles2)]
+    matchers = {}
+
+    for i, line1 in enumerate(lines1, 1):
+        matches = []
+        words1, bigrams1 = shingles1[i - 1]
+
+        # Кандидаты - строки, пересекающиеся с этой по префиксам. Первое
+        # общее слово или биграмма префиксов - первое общее вообще, поэтому
+        # общих элементов не больше, чем осталось после него в обеих строках.
+        seen = set()
+        candidates = []
+        size1 = len(words1), len(bigrams1), len(line1)
+        for token, is_word, words_left1, bigrams_left1 in shingle_prefix(words1, bigrams1, frequency):
+            for j, words_left2, bigrams_left2 in prefix_index.get(token, ()):
+                if j in seen:
+                    continue
+                seen.add(j)
+
+                if bound_line_similarity(
+                    size1, sizes2[j - 1],
+                    is_word + min(words_left1, words_left2),
+                    (not is_word) + min(bigrams_left1, bigrams_left2)
+                ) > 50:
+                    candidates.append(j)
+
+        for j in sorted(candidates):
+            line2 = lines2[j - 1]
+            words2, bigrams2 = shingles2[j - 1]
+            common_words = len(words1 & words2)
+            common_bigrams = len(bigrams1 & bigrams2)
+
+            def blend(seq_similarity):
+                return blend_line_similarity(
+                    shingles1[i - 1], shingles2[j - 1], common_words, common_bigrams, seq_similarity
+                )
+
+            # Сначала дешевые верхние оценки SequenceMatcher, затем точный расчет
+            if blend(2.0 * min(len(line1), len(line2)) / (len(line1) + len(line2)) * 100) <= 50:
+                continue
+
+            matcher = matchers.get(j)
+            if matcher is None:
+                matcher = matchers[j] = SequenceMatcher(None, '', line2)
+            matcher.set_seq1(line1)
+
+            if blend(matcher.quick_ratio() * 100) <= 50:
+                continue
+
+            line_similarity = blend(matcher.ratio() * 100)
+            if line_similarity > 50:  # Порог для похожих строк
+                matches.append({
+                    'line1_num': i,
+                    'line1_text': line1,
+                    'line2_num': j,
+                    'line2_text': line2,
+                    'similarity': line_similarity
+                })
+
+        yield i, matches
+
+
+def find_similar_lines(text1, text2):
+    """Поиск похожих строк в текстах"""
+    similar_lines = []
+    for _, matches in iter_similar_lines(text1, text2):
+        similar_lines.extend(matches)
+    return similar_lines
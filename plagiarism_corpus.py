@@ -0,0 +1,55 @@
+import hashlib
+
+
+# 56 бит: значения сигнатуры вместе со сдвигом уплотнения помещаются в 64 бита
+HASH_BITS = 56
+
+
+def shingle_hash(shingle):
+    """Стабильный хеш шингла (не зависит от PYTHONHASHSEED)"""
+    digest = hashlib.blake2b(shingle.encode('utf-8'), digest_size=HASH_BITS // 8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+def minhash_signature(shingles, num_perm=128):
+    """MinHash-сигнатура множества шинглов.
+
+    Используется хеширование одной перестановкой: хеш шингла делится на
+    num_perm корзин, в каждой хранится минимум. Пустые корзины заполняются
+    значением ближайшей непустой справа со сдвигом (уплотнение), так что
+    сигнатура строится за один проход по шинглам, а не num_perm проходов.
+    Доля совпадающих позиций двух сигнатур оценивает их меру Жаккара.
+    """
+    if not shingles:
+        return None
+
+    bin_size = (1 << HASH_BITS) // num_perm + 1
+    bins = [None] * num_perm
+    for shingle in shingles:
+        value = shingle_hash(shingle)
+        index = value % num_perm
+        value //= num_perm
+        if bins[index] is None or value < bins[index]:
+            bins[index] = value
+
+    # Уплотнение: два прохода справа налево по кругу
+    signature = list(bins)
+    nearest = None
+    distance = 0
+    for step in range(2 * num_perm - 1, -1, -1):
+        index = step % num_perm
+        if bins[index] is not None:
+            nearest = bins[index]
+            distance = 0
+        else:
+            distance += 1
+            if nearest is not None:
+                signature[index] = nearest + distance * bin_size
+
+    return tuple(signature)
+
+
+def estimate_jaccard(signature1, signature2):
+    """Оценка меры Жаккара по двум MinHash-сигнатурам"""
+    same = sum(1 for a, b in zip(signature1, signature2) if a == b)
+    return same / len(signature1)
@@ -0,0 +1,135 @@
+import codecs
+import os
+import re
+
+from plagiarism_core import preprocess_text
+
+
+# Последнее (возможно, неполное) слово части текста
+TAIL_PATTERN = re.compile(r'\s\S*\Z')
+
+
+def detect_encoding(data):
+    """Выбор между UTF-8 и CP1251 по началу файла с не-ASCII байтами.
+
+    Возвращает None, если данных пока недостаточно: все не-ASCII байты
+    могут оказаться началом еще не прочитанного символа UTF-8.
+    """
+    try:
+        # Неполный символ на конце части ошибкой не считается
+        decoded = codecs.getincrementaldecoder('utf-8')().decode(data, final=False)
+    except UnicodeDecodeError:
+        return 'cp1251'
+    return None if decoded.isascii() else 'utf-8'
+
+
+class TextFileReader:
+    """Потоковое чтение текстового файла частями с определением кодировки.
+
+    Пока идут только ASCII-байты, кодировка не важна; она определяется по
+    первым не-ASCII байтам, поэтому файл читается ровно один раз.
+    """
+
+    def __init__(self, path, chunk_size=1 << 20):
+        self.path = path
+        self.chunk_size = chunk_size
+        self.size = os.path.getsize(path)
+        self.bytes_read = 0
+        self.encoding = None
+
+    def __iter__(self):
+        decoder = None
+        pending = b''
+
+        with open(self.path, 'rb') as file:
+            data = file.read(self.chunk_size)
+            if data.startswith(codecs.BOM_UTF8):
+                self.encoding = 'utf-8-sig'
+
+            while data:
+                self.bytes_read += len(data)
+
+                if decoder is None:
+                    if not pending and not self.encoding and data.isascii():
+                        yield data.decode('ascii')
+                        data = file.read(self.chunk_size)
+                        continue
+
+                    # Байты копятся, пока по ним нельзя выбрать кодировку
+                    pending += data
+                    self.encoding = self.encoding or detect_encoding(pending)
+                    if self.encoding is None:
+                        data = file.read(self.chunk_size)
+                        continue
+
+                    decoder = codecs.getincrementaldecoder(self.encoding)(errors='replace')
+                    data, pending = pending, b''
+
+                yield decoder.decode(data)
+                data = file.read(self.chunk_size)
+
+        self.encoding = self.encoding or 'utf-8'
+        if decoder is None:
+            decoder = codecs.getincrementaldecoder(self.encoding)(errors='replace')
+        tail = decoder.decode(pending, final=True)
+        if tail:
+            yield tail
+
+
+def read_text_file(path):
+    """Весь текст файла в UTF-8 или CP1251 (как TextFileReader) с переводами строк '\\n'"""
+    text = ''.join(TextFileReader(path))
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
+
+class StreamingShingles:
+    """Слова и биграммы текста, поступающего частями (как text_shingles).
+
+    Часть обрабатывается до последнего пробельного символа, а неполное
+    слово переносится в следующую. Сам текст не хранится - только начало
+    для предпросмотра.
+    """
+
+    def __init__(self, preview_chars=20000):
+        self.words = set()
+        self.bigrams = set()
+        self.word_count = 0
+        self.char_count = 0
+        self.preview = ''
+        self.preview_chars = preview_chars
+        self.tail = ''
+        self.previous_word = None
+
+    def feed(self, text):
+        """Обработка очередной части текста"""
+        self.char_count += len(text)
+        if len(self.preview) < self.preview_chars:
+            self.preview += text[:self.preview_chars - len(self.preview)]
+
+        text = self.tail + text
+        # Последний пробел ищется сначала в конце части - так быстрее
+        match = TAIL_PATTERN.search(text, max(0, len(text) - 4096)) or TAIL_PATTERN.search(text)
+        if match is None:
+            self.tail = text
+            return
+
+        self.tail = text[match.start():]
+        self.add_text(text[:match.start()])
+
+    def finish(self):
+        """Обработка остатка после последней части"""
+        self.add_text(self.tail)
+        self.tail = ''
+
+    def add_text(self, text):
+        self.word_count += len(text.split())
+
+        words = preprocess_text(text).split()
+        if not words:
+            return
+
+        self.words.update(words)
+        if self.previous_word is not None:
+            self.bigrams.add(self.previous_word + ' ' + words[0])
+        self.bigrams.update(map(' '.join, zip(words, words[1:])))
+        self.previous_word = words[-1]
@@ -0,0 +1,180 @@
+import sqlite3
+import struct
+
+from plagiarism_core import preprocess_text, similarity_from_shingles, text_shingles, tokens_shingles
+from plagiarism_corpus import estimate_jaccard, minhash_signature
+
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    doc_id TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    tokens TEXT NOT NULL,
+    signature BLOB
+);
+CREATE TABLE IF NOT EXISTS bands (
+    band INTEGER NOT NULL,
+    key BLOB NOT NULL,
+    doc_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bands_key ON bands (band, key);
+CREATE INDEX IF NOT EXISTS bands_doc ON bands (doc_id);
+'''
+
+
+def pack_values(values):
+    """Упаковка значений сигнатуры в BLOB"""
+    return struct.pack(f'<{len(values)}Q', *values)
+
+
+def unpack_values(blob):
+    """Распаковка значений сигнатуры из BLOB"""
+    return struct.unpack(f'<{len(blob) // 8}Q', blob)
+
+
+class CorpusStore:
+    """Корпус документов в файле SQLite с LSH-индексом для поиска почти дубликатов.
+
+    Для каждого документа хранятся исходный текст (для SequenceMatcher),
+    результат preprocess_text и MinHash-сигнатура, а ключи LSH-полос лежат
+    в индексированной таблице. При открытии в память ничего не читается:
+    поиск кандидатов идет запросами по индексу полос, а слова и биграммы
+    документа восстанавливаются из сохраненных токенов без повторной
+    предобработки. Документы добавляются и удаляются по одному.
+
+    Сигнатура делится на bands полос; документы с полностью совпавшей хотя бы
+    одной полосой попадают в кандидаты. Кандидаты ранжируются по оценке
+    MinHash, а лучшие top_k получают точную оценку calculate_similarity.
+    """
+
+    def __init__(self, path, num_perm=128, bands=32):
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.executescript(SCHEMA)
+
+        # Параметры сигнатур существующего индекса важнее переданных
+        meta = dict(self.connection.execute('SELECT name, value FROM meta'))
+        if meta:
+            num_perm = int(meta['num_perm'])
+            bands = int(meta['bands'])
+        elif num_perm % bands != 0:
+            raise ValueError("Число перестановок должно делиться на число полос")
+        else:
+            self.connection.executemany(
+                'INSERT INTO meta (name, value) VALUES (?, ?)',
+                [('num_perm', str(num_perm)), ('bands', str(bands))]
+            )
+            self.connection.commit()
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+
+    def __len__(self):
+        return self.connection.execute('SELECT COUNT(*) FROM documents').fetchone()[0]
+
+    def __contains__(self, doc_id):
+        row = self.connection.execute('SELECT 1 FROM documents WHERE doc_id = ?', (doc_id,)).fetchone()
+        return row is not None
+
+    def band_keys(self, signature):
+        """Ключи полос сигнатуры для LSH"""
+        for band in range(self.bands):
+            yield band, pack_values(signature[band * self.rows:(band + 1) * self.rows])
+
+    def add_document(self, doc_id, text, commit=True):
+        """Добавление (или замена) документа в корпусе.
+
+        При массовой загрузке передайте commit=False и вызовите commit()
+        после пачки документов.
+        """
+        self.remove_document(doc_id, commit=False)
+
+        tokens = preprocess_text(text)
+        words, bigrams = tokens_shingles(tokens)
+        signature = minhash_signature(bigrams or words, self.num_perm)
+
+        self.connection.execute(
+            'INSERT INTO documents (doc_id, text, tokens, signature) VALUES (?, ?, ?, ?)',
+            (doc_id, text, tokens, pack_values(signature) if signature else None)
+        )
+        if signature is not None:
+            self.connection.executemany(
+                'INSERT INTO bands (band, key, doc_id) VALUES (?, ?, ?)',
+                [(band, key, doc_id) for band, key in self.band_keys(signature)]
+            )
+
+        if commit:
+            self.commit()
+
+    def remove_document(self, doc_id, commit=True):
+        """Удаление документа из корпуса"""
+        self.connection.execute('DELETE FROM bands WHERE doc_id = ?', (doc_id,))
+        self.connection.execute('DELETE FROM documents WHERE doc_id = ?', (doc_id,))
+
+        if commit:
+            self.commit()
+
+    def commit(self):
+        """Сохранение накопленных изменений на диск"""
+        self.connection.commit()
+
+    def close(self):
+        self.connection.commit()
+        self.connection.close()
+
+    def shingles_candidates(self, shingles, top_k=10):
+        """Лучшие кандидаты по LSH для заранее посчитанных text_shingles:
+        список (doc_id, оценка Жаккара)"""
+        words, bigrams = shingles
+        signature = minhash_signature(bigrams or words, self.num_perm)
+        if signature is None:
+            return []
+
+        found = set()
+        for band, key in self.band_keys(signature):
+            rows = self.connection.execute('SELECT doc_id FROM bands WHERE band = ? AND key = ?', (band, key))
+            found.update(doc_id for doc_id, in rows)
+
+        ranked = []
+        found = sorted(found)
+        # Ограничение SQLite на число параметров запроса
+        for start in range(0, len(found), 500):
+            chunk = found[start:start + 500]
+            rows = self.connection.execute(
+                f'SELECT doc_id, signature FROM documents WHERE doc_id IN ({", ".join("?" * len(chunk))})',
+                chunk
+            )
+            ranked.extend((doc_id, estimate_jaccard(signature, unpack_values(blob))) for doc_id, blob in rows)
+
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        return ranked[:top_k]
+
+    def query(self, text, top_k=10, sequence='chars', threshold=0.0):
+        """Поиск похожих документов корпуса с точной оценкой схожести.
+
+        threshold (в процентах) - как в similarity_from_shingles: нужен
+        способу 'bounded'.
+        """
+        shingles = text_shingles(text)
+
+        results = []
+        for doc_id, estimate in self.shingles_candidates(shingles, top_k):
+            document_text, tokens = self.connection.execute(
+                'SELECT text, tokens FROM documents WHERE doc_id = ?', (doc_id,)
+            ).fetchone()
+            results.append({
+                'doc_id': doc_id,
+                'estimated_similarity': round(estimate * 100, 2),
+                'similarity': similarity_from_shingles(
+                    text, shingles, document_text, tokens_shingles(tokens), sequence, threshold
+                )
+            })
+
+        results.sort(key=lambda result: -result['similarity'])
+        return results
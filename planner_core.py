@@ -0,0 +1,107 @@
+import heapq
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from operator import attrgetter
+
+
+# Формат даты и времени в списке событий (как 'dd.MM.yyyy HH:mm' у QDateTime)
+DISPLAY_FORMAT = '%d.%m.%Y %H:%M'
+
+event_timestamp = attrgetter('timestamp')
+
+
+def local_datetime(timestamp):
+    """Местное время по секундам от эпохи.
+
+    В Windows время до 1970 года (отрицательные секунды) не переводится
+    в местное - тогда пояс берется на начало эпохи, без летнего времени.
+    """
+    try:
+        return datetime.fromtimestamp(timestamp)
+    except (OSError, OverflowError, ValueError):
+        return datetime.fromtimestamp(0) + timedelta(seconds=timestamp)
+
+
+class Event:
+    """Событие ежедневника: время в секундах от эпохи и название.
+
+    Запись без __dict__ и без QDateTime занимает в несколько раз меньше
+    памяти, а строка для списка формируется только при отрисовке.
+    event_id - ключ записи в хранилище (None, пока событие не сохранено).
+    """
+
+    __slots__ = ('timestamp', 'name', 'event_id')
+
+    def __init__(self, timestamp, name, event_id=None):
+        self.timestamp = timestamp
+        self.name = name
+        self.event_id = event_id
+
+    def __repr__(self):
+        return f"Event({self.timestamp!r}, {self.name!r}, {self.event_id!r})"
+
+    def display_text(self):
+        """Строка события для списка"""
+        return f"{local_datetime(self.timestamp).strftime(DISPLAY_FORMAT)} - {self.name}"
+
+
+def day_key(timestamp):
+    """Местная дата события в виде числа ГГГГММДД"""
+    moment = local_datetime(timestamp)
+    return moment.year * 10000 + moment.month * 100 + moment.day
+
+
+def insert_position(events, timestamp):
+    """Позиция для вставки в отсортированный список событий (после равных по времени)"""
+    return bisect_right(events, timestamp, key=event_timestamp)
+
+
+class ReminderQueue:
+    """Очередь напоминаний: куча (heapq) событий по времени.
+
+    Добавление - O(log n). Удаление ленивое: запись помечается и
+    выбрасывается, только когда окажется на вершине кучи, поэтому куча
+    не перестраивается. Событие в очереди должно иметь event_id.
+    """
+
+    def __init__(self):
+        self.heap = []
+        # event_id -> запись кучи [timestamp, event_id, event]
+        self.entries = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def push(self, event):
+        """Добавление (или перенос) напоминания о событии"""
+        self.remove(event.event_id)
+        entry = [event.timestamp, event.event_id, event]
+        self.entries[event.event_id] = entry
+        heapq.heappush(self.heap, entry)
+
+    def remove(self, event_id):
+        """Отмена напоминания о событии"""
+        entry = self.entries.pop(event_id, None)
+        if entry is not None:
+            entry[-1] = None
+
+    def clear(self):
+        self.heap.clear()
+        self.entries.clear()
+
+    def next_time(self):
+        """Время ближайшего напоминания или None"""
+        while self.heap and self.heap[0][-1] is None:
+            heapq.heappop(self.heap)
+        return self.heap[0][0] if self.heap else None
+
+    def pop_due(self, now):
+        """Извлечение всех напоминаний со временем не позже now"""
+        due = []
+        while True:
+            next_time = self.next_time()
+            if next_time is None or next_time > now:
+                return due
+            event = heapq.heappop(self.heap)[-1]
+            del self.entries[event.event_id]
+            due.append(event)
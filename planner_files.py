@@ -0,0 +1,199 @@
+import csv
+import os
+import re
+from datetime import datetime, timedelta, timezone
+
+from planner_core import DISPLAY_FORMAT, Event, local_datetime
+
+
+CSV_FIELDS = ['datetime', 'name']
+
+# Начало эпохи в UTC: от него время считается одинаково на всех системах
+# (datetime.fromtimestamp в Windows не принимает время до 1970 года)
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# Экранирование текста в iCalendar (RFC 5545, 3.3.11)
+ICS_ESCAPED = re.compile(r'\\(.)')
+ICS_UNESCAPE = {'n': ' ', 'N': ' '}
+
+
+def unescape_ics_text(text):
+    """Текст iCalendar без экранирования; переносы строк заменяются пробелами"""
+    return ICS_ESCAPED.sub(lambda match: ICS_UNESCAPE.get(match.group(1), match.group(1)), text)
+
+
+def parse_ics_datetime(value, params):
+    """Время DTSTART в секундах от эпохи.
+
+    Время с Z - в UTC, дата без времени - местная полночь. Время с TZID
+    считается местным: таблиц часовых поясов здесь нет.
+    """
+    if 'VALUE=DATE' in params or len(value) == 8:
+        return int(datetime.strptime(value[:8], '%Y%m%d').timestamp())
+    if value.endswith('Z'):
+        moment = datetime.strptime(value, '%Y%m%dT%H%M%SZ').replace(tzinfo=timezone.utc)
+        return int(moment.timestamp())
+    return int(datetime.strptime(value, '%Y%m%dT%H%M%S').timestamp())
+
+
+def parse_csv_datetime(value):
+    """Время из CSV: 'дд.мм.гггг чч:мм' (как в списке событий) или ISO 8601"""
+    value = value.strip()
+    try:
+        moment = datetime.strptime(value, DISPLAY_FORMAT)
+    except ValueError:
+        moment = datetime.fromisoformat(value)
+    return int(moment.timestamp())
+
+
+def unfold_lines(lines):
+    """Склейка перенесенных строк iCalendar (продолжение начинается с пробела)"""
+    current = None
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if line[:1] in (' ', '\t') and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current is not None:
+        yield current
+
+
+class EventFileReader:
+    """Потоковое чтение событий из файла .ics или .csv.
+
+    Файл читается построчно, события выдаются по одному, поэтому память
+    не зависит от размера календаря. Записи, которые не удалось
+    разобрать, пропускаются и подсчитываются в skipped.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.size = os.path.getsize(path)
+        self.skipped = 0
+        self.file = None
+
+    @property
+    def bytes_read(self):
+        if self.file is None or self.file.closed:
+            return self.size
+        return self.file.buffer.tell()
+
+    def __iter__(self):
+        is_ics = self.path.lower().endswith('.ics')
+        with open(self.path, encoding='utf-8-sig', errors='replace', newline='') as self.file:
+            yield from self.read_ics() if is_ics else self.read_csv()
+
+    def read_ics(self):
+        start = None
+        name = None
+        in_event = False
+
+        for line in unfold_lines(self.file):
+            prop, _, value = line.partition(':')
+            prop_name, *params = prop.split(';')
+            prop_name = prop_name.upper()
+
+            if prop_name == 'BEGIN' and value.upper() == 'VEVENT':
+                in_event = True
+                start = None
+                name = None
+            elif not in_event:
+                continue
+            elif prop_name == 'END' and value.upper() == 'VEVENT':
+                in_event = False
+                if start is None:
+                    self.skipped += 1
+                else:
+                    yield Event(start, name or "Без названия")
+            elif prop_name == 'DTSTART':
+                try:
+                    start = parse_ics_datetime(value.strip(), [param.upper() for param in params])
+                except (ValueError, OverflowError):
+                    start = None
+            elif prop_name == 'SUMMARY':
+                name = unescape_ics_text(value).strip()
+
+    def read_csv(self):
+        for number, row in enumerate(csv.reader(self.file)):
+            if not row or not any(cell.strip() for cell in row):
+                continue
+            try:
+                timestamp = parse_csv_datetime(row[0])
+                name = row[1].strip()
+            except (ValueError, OverflowError, IndexError):
+                # Первая строка может быть заголовком
+                if number > 0:
+                    self.skipped += 1
+                continue
+            if not name:
+                self.skipped += 1
+                continue
+            yield Event(timestamp, name)
+
+
+def escape_ics_text(text):
+    """Экранирование текста для iCalendar"""
+    return (text.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+
+def fold_ics_line(line):
+    """Перенос строки iCalendar: не более 75 байт UTF-8 в строке"""
+    data = line.encode('utf-8')
+    parts = []
+    start = 0
+    # Строка продолжения начинается с пробела, он тоже занимает байт
+    limit = 75
+    while len(data) - start > limit:
+        end = start + limit
+        # Символ UTF-8 не разрывается: байты продолжения имеют вид 10xxxxxx
+        while data[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(data[start:end])
+        start = end
+        limit = 74
+    parts.append(data[start:])
+    return b'\r\n '.join(parts).decode('utf-8') + '\r\n'
+
+
+def write_ics(events, file):
+    """Потоковая запись событий в формате iCalendar; возвращает их число"""
+    stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    file.write('BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//DailyPlanner//RU\r\n')
+
+    count = 0
+    for event in events:
+        start = (EPOCH + timedelta(seconds=event.timestamp)).strftime('%Y%m%dT%H%M%SZ')
+        file.write('BEGIN:VEVENT\r\n')
+        file.write(f'UID:{event.event_id}@daily-planner\r\n')
+        file.write(f'DTSTAMP:{stamp}\r\n')
+        file.write(f'DTSTART:{start}\r\n')
+        file.write(fold_ics_line(f'SUMMARY:{escape_ics_text(event.name)}'))
+        file.write('END:VEVENT\r\n')
+        count += 1
+
+    file.write('END:VCALENDAR\r\n')
+    return count
+
+
+def write_csv(events, file):
+    """Потоковая запись событий в CSV (время как в списке событий); возвращает их число"""
+    writer = csv.writer(file)
+    writer.writerow(CSV_FIELDS)
+
+    count = 0
+    for event in events:
+        writer.writerow([local_datetime(event.timestamp).strftime(DISPLAY_FORMAT), event.name])
+        count += 1
+    return count
+
+
+def write_events(path, events):
+    """Запись событий в файл .ics или .csv по расширению; возвращает их число"""
+    with open(path, 'w', encoding='utf-8', newline='') as file:
+        if path.lower().endswith('.ics'):
+            return write_ics(events, file)
+        return write_csv(events, file)
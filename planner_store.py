@@ -0,0 +1,153 @@
+import sqlite3
+from collections import Counter
+
+from planner_core import Event, day_key
+
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS events (
+    event_id INTEGER PRIMARY KEY,
+    timestamp INTEGER NOT NULL,
+    name TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_timestamp ON events (timestamp, event_id);
+CREATE TABLE IF NOT EXISTS days (
+    day INTEGER PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+'''
+
+
+class EventStore:
+    """События ежедневника в файле SQLite.
+
+    Журнал WAL делает каждую фиксацию атомарной: после сбоя в файле
+    остаются все зафиксированные изменения и ни одного частичного.
+    События упорядочены по (timestamp, event_id) - при равном времени
+    раньше идет добавленное раньше, как при вставке bisect_right, - и
+    читаются страницами по индексу, так что в память попадает только
+    то, что показано. Выборка за период [start, end) - это поиск по
+    индексу и чтение k событий периода, то есть O(log n + k).
+
+    Таблица days хранит число событий каждого дня (day_key) и
+    обновляется вместе с событиями - по ней подсвечивается календарь.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.executescript(SCHEMA)
+
+    def __len__(self):
+        return self.connection.execute('SELECT COUNT(*) FROM events').fetchone()[0]
+
+    def add_event(self, event, commit=True):
+        """Сохранение нового события; event.event_id получает ключ записи.
+
+        При серии изменений передайте commit=False и вызовите commit()
+        после пачки.
+        """
+        cursor = self.connection.execute(
+            'INSERT INTO events (timestamp, name) VALUES (?, ?)', (event.timestamp, event.name)
+        )
+        event.event_id = cursor.lastrowid
+        self.connection.execute(
+            'INSERT INTO days (day, count) VALUES (?, 1) ON CONFLICT (day) DO UPDATE SET count = count + 1',
+            (day_key(event.timestamp),)
+        )
+
+        if commit:
+            self.commit()
+
+    def add_events(self, events, commit=True):
+        """Сохранение пачки новых событий одним запросом.
+
+        Ключи записей событиям не присваиваются: пачка идет из импорта и
+        в памяти не остается.
+        """
+        rows = [(event.timestamp, event.name) for event in events]
+        self.connection.executemany('INSERT INTO events (timestamp, name) VALUES (?, ?)', rows)
+
+        counts = Counter(day_key(timestamp) for timestamp, _ in rows)
+        self.connection.executemany(
+            'INSERT INTO days (day, count) VALUES (?, ?) ON CONFLICT (day) DO UPDATE SET count = count + excluded.count',
+            counts.items()
+        )
+
+        if commit:
+            self.commit()
+
+    def remove_event(self, event, commit=True):
+        """Удаление события"""
+        cursor = self.connection.execute('DELETE FROM events WHERE event_id = ?', (event.event_id,))
+        if cursor.rowcount:
+            day = day_key(event.timestamp)
+            self.connection.execute('UPDATE days SET count = count - 1 WHERE day = ?', (day,))
+            self.connection.execute('DELETE FROM days WHERE day = ? AND count <= 0', (day,))
+
+        if commit:
+            self.commit()
+
+    def clear(self, commit=True):
+        """Удаление всех событий"""
+        self.connection.execute('DELETE FROM events')
+        self.connection.execute('DELETE FROM days')
+
+        if commit:
+            self.commit()
+
+    def commit(self):
+        """Сохранение накопленных изменений на диск"""
+        self.connection.commit()
+
+    def close(self):
+        self.connection.commit()
+        self.connection.close()
+
+    def count(self, start=None, end=None):
+        """Число событий с временем в [start, end) (без границ - всех)"""
+        if start is None:
+            return len(self)
+        return self.connection.execute(
+            'SELECT COUNT(*) FROM events WHERE timestamp >= ? AND timestamp < ?', (start, end)
+        ).fetchone()[0]
+
+    def day_counts(self, first_day, last_day):
+        """Число событий по дням с first_day по last_day включительно: {day_key: count}"""
+        return dict(self.connection.execute(
+            'SELECT day, count FROM days WHERE day BETWEEN ? AND ?', (first_day, last_day)
+        ))
+
+    def events_after(self, event=None, limit=500, start=None, end=None):
+        """Следующая страница событий после event (с начала, если None).
+
+        start и end ограничивают время событий периодом [start, end);
+        любую из границ можно не задавать.
+        """
+        conditions = []
+        parameters = []
+        if event is not None:
+            conditions.append('(timestamp, event_id) > (?, ?)')
+            parameters += [event.timestamp, event.event_id]
+        if start is not None:
+            conditions.append('timestamp >= ?')
+            parameters.append(start)
+        if end is not None:
+            conditions.append('timestamp < ?')
+            parameters.append(end)
+
+        where = f'WHERE {" AND ".join(conditions)} ' if conditions else ''
+        rows = self.connection.execute(
+            f'SELECT timestamp, name, event_id FROM events {where}ORDER BY timestamp, event_id LIMIT ?',
+            parameters + [limit]
+        )
+        return [Event(*row) for row in rows]
+
+    def iter_events(self, page_size=5000):
+        """Все события по порядку, страницами (для потоковой выгрузки)"""
+        page = self.events_after(None, page_size)
+        while page:
+            yield from page
+            page = self.events_after(page[-1], page_size)
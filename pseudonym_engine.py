@@ -0,0 +1,65 @@
+import random
+
+from pseudonym_solver import GameSolver
+
+
+# Позиция - число камней в кучке, ходы и вариант игры задает GameSolver.
+# Стратегия - функция (solver, stones, rng) -> сколько камней взять.
+
+def optimal_move(solver, stones, rng=random):
+    """Оптимальный ход: оставить противнику проигрышную позицию.
+
+    Из проигрышной позиции хода лучше других нет - берется случайный.
+    Этой стратегией ходит компьютер в окне игры.
+    """
+    stones_to_take = solver.winning_move(stones)
+    if stones_to_take is None:
+        return rng.choice(solver.legal_moves(stones))
+    return stones_to_take
+
+
+def random_move(solver, stones, rng=random):
+    """Случайный допустимый ход"""
+    return rng.choice(solver.legal_moves(stones))
+
+
+def greedy_move(solver, stones, rng=random):
+    """Взять как можно больше камней"""
+    return solver.legal_moves(stones)[-1]
+
+
+STRATEGIES = {
+    'optimal': optimal_move,
+    'random': random_move,
+    'greedy': greedy_move,
+}
+
+
+def play_game(solver, stones, first, second, rng=random):
+    """Партия между стратегиями first и second; возвращает 0, если победил
+    первый игрок, и 1, если второй.
+
+    Кто не может сделать ход, тот проиграл (в поддавках - выиграл), так
+    что взявший последний камень побеждает, а в поддавках проигрывает.
+    """
+    strategies = (first, second)
+    player = 0
+    while solver.legal_moves(stones):
+        stones -= strategies[player](solver, stones, rng)
+        player = 1 - player
+    return player if solver.misere else 1 - player
+
+
+def play_games(moves, misere, first, second, stones_range, games, seed):
+    """Серия партий со случайным начальным числом камней из stones_range
+    (границы включительно); возвращает число побед первого игрока"""
+    solver = GameSolver(moves, misere)
+    rng = random.Random(seed)
+    first, second = STRATEGIES[first], STRATEGIES[second]
+    low, high = stones_range
+
+    wins = 0
+    for _ in range(games):
+        if play_game(solver, rng.randint(low, high), first, second, rng) == 0:
+            wins += 1
+    return wins
@@ -0,0 +1,163 @@
+import argparse
+import itertools
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from pseudonym_engine import STRATEGIES, optimal_move, play_games
+from pseudonym_solver import GameSolver
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+BATCH_SIZE = 100000
+
+
+def max_move(moves):
+    """m для правила "взять от 1 до m камней" (остаток по модулю m + 1), иначе None"""
+    moves = sorted(set(moves))
+    return moves[-1] if moves == list(range(1, moves[-1] + 1)) else None
+
+
+def numpy_optimal(stones, m, misere, rng):
+    # Проигрышные позиции: stones % (m + 1) == 0, в поддавках - == 1
+    take = (stones - misere) % (m + 1)
+    losing = take == 0
+    take[losing] = rng.integers(1, numpy.minimum(stones[losing], m) + 1)
+    return take
+
+
+def numpy_random(stones, m, misere, rng):
+    return rng.integers(1, numpy.minimum(stones, m) + 1)
+
+
+def numpy_greedy(stones, m, misere, rng):
+    return numpy.minimum(stones, m)
+
+
+NUMPY_STRATEGIES = {
+    'optimal': numpy_optimal,
+    'random': numpy_random,
+    'greedy': numpy_greedy,
+}
+
+
+def numpy_play_games(m, misere, first, second, stones_range, games, seed):
+    """То же, что play_games, для правила "взять от 1 до m", но все партии
+    пачки идут одновременно: за шаг цикла ход делается во всех
+    незаконченных партиях сразу"""
+    rng = numpy.random.default_rng(seed)
+    low, high = stones_range
+    stones = rng.integers(low, high + 1, size=games)
+    strategies = (NUMPY_STRATEGIES[first], NUMPY_STRATEGIES[second])
+
+    # Партии с пустой кучкой заканчиваются сразу: первый не может сходить
+    first_wins = int(numpy.count_nonzero(stones == 0)) if misere else 0
+    active = numpy.flatnonzero(stones)
+    player = 0
+    while active.size:
+        left = stones[active]
+        left -= strategies[player](left, m, misere, rng)
+        stones[active] = left
+
+        finished = numpy.count_nonzero(left == 0)
+        # Взявший последний камень побеждает, в поддавках - проигрывает
+        if (player == 0) != misere:
+            first_wins += int(finished)
+        active = active[left > 0]
+        player = 1 - player
+    return first_wins
+
+
+def simulate_batch(task):
+    """Пачка партий в процессе пула: число побед первого игрока"""
+    moves, misere, first, second, stones_range, games, seed, use_numpy = task
+    m = max_move(moves)
+    if use_numpy and numpy is not None and m is not None:
+        return numpy_play_games(m, misere, first, second, stones_range, games, seed)
+    return play_games(moves, misere, first, second, stones_range, games, seed)
+
+
+def simulate(moves, misere, first, second, stones_range, games, workers, use_numpy=True, seed=None):
+    """Партии first против second пачками в пуле процессов.
+
+    Возвращает (победы первого игрока, время в секундах).
+    """
+    seed = random.randrange(2 ** 32) if seed is None else seed
+    tasks = []
+    for number, start in enumerate(range(0, games, BATCH_SIZE)):
+        size = min(BATCH_SIZE, games - start)
+        tasks.append((moves, misere, first, second, stones_range, size, seed << 32 | number, use_numpy))
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        wins = sum(executor.map(simulate_batch, tasks))
+    return wins, time.perf_counter() - started
+
+
+def benchmark_moves(moves, misere, count, seed=None):
+    """Замер и проверка оптимального хода - того же, что делает компьютер
+    в окне игры (PseudonymGame.calculate_computer_move).
+
+    Позиции берутся от малых до огромных. Ход из выигрышной позиции
+    должен оставлять противнику проигрышную; возвращает (ходов в
+    секунду, число неверных ходов).
+    """
+    rng = random.Random(seed)
+    solver = GameSolver(moves, misere)
+    positions = [rng.randint(solver.moves[0], 10 ** rng.randint(2, 18)) for _ in range(count)]
+
+    started = time.perf_counter()
+    chosen = [optimal_move(solver, stones, rng) for stones in positions]
+    elapsed = time.perf_counter() - started
+
+    errors = 0
+    for stones, stones_to_take in zip(positions, chosen):
+        if stones_to_take not in solver.legal_moves(stones):
+            errors += 1
+        elif solver.is_winning(stones) and solver.is_winning(stones - stones_to_take):
+            errors += 1
+    return count / elapsed, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Моделирование партий игры 'Псевдоним' между стратегиями")
+    parser.add_argument('--first', choices=sorted(STRATEGIES), help="стратегия первого игрока (по умолчанию все)")
+    parser.add_argument('--second', choices=sorted(STRATEGIES), help="стратегия второго игрока (по умолчанию все)")
+    parser.add_argument('--games', type=int, default=1000000, help="число партий для каждой пары стратегий")
+    parser.add_argument('--stones', type=int, nargs=2, default=[10, 100], metavar=('MIN', 'MAX'),
+                        help="начальное число камней выбирается случайно из этого отрезка")
+    parser.add_argument('--moves', type=int, nargs='+', default=[1, 2, 3], help="сколько камней можно взять")
+    parser.add_argument('--misere', action='store_true', help="поддавки: взявший последний камень проигрывает")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="число процессов")
+    parser.add_argument('--no-numpy', action='store_true', help="не использовать NumPy")
+    parser.add_argument('--seed', type=int, help="зерно генератора для повторяемых результатов")
+    parser.add_argument('--benchmark', type=int, metavar='COUNT',
+                        help="только замерить и проверить COUNT оптимальных ходов компьютера")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        speed, errors = benchmark_moves(args.moves, args.misere, args.benchmark, args.seed)
+        print(f"Оптимальный ход: {speed:,.0f} ходов/с, неверных ходов: {errors}")
+        sys.exit(1 if errors else 0)
+
+    fast = not args.no_numpy and numpy is not None and max_move(args.moves) is not None
+    print(f"Ходы: {args.moves}, {'поддавки' if args.misere else 'обычная игра'}, "
+          f"камней {args.stones[0]}-{args.stones[1]}, {'NumPy' if fast else 'Python'}")
+    print(f"{'первый':<10}{'второй':<10}{'побед первого':>15}{'партий/с':>14}")
+
+    firsts = [args.first] if args.first else sorted(STRATEGIES)
+    seconds = [args.second] if args.second else sorted(STRATEGIES)
+    for first, second in itertools.product(firsts, seconds):
+        wins, elapsed = simulate(args.moves, args.misere, first, second, tuple(args.stones),
+                                 args.games, args.workers, not args.no_numpy, args.seed)
+        print(f"{first:<10}{second:<10}{wins / args.games:>14.2%}{args.games / elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+import threading
+from functools import lru_cache
+
+
+class PeriodicTable:
+    """Значения f(0), f(1), ... игры вычитания, вычисляемые по мере надобности.
+
+    f(n) зависит только от f(n - s) для ходов s, то есть от последних
+    max(moves) значений. Как только такое окно значений повторилось,
+    последовательность дальше периодична, и f(n) для любого n берется из
+    уже посчитанной части за O(1). Значения ограничены, поэтому различных
+    окон конечное число и период находится за ограниченное число шагов.
+
+    Таблица дополняется под блокировкой, поэтому ее можно читать из
+    потока, в котором компьютер считает ход.
+    """
+
+    def __init__(self, moves, rule):
+        self.moves = sorted(set(moves))
+        self.window = self.moves[-1]
+        # rule(values, n) - значение f(n) по уже посчитанным f(0..n-1)
+        self.rule = rule
+        self.values = []
+        # Окно последних значений -> индекс его последнего элемента
+        self.seen = {}
+        self.start = None
+        self.period = None
+        self.lock = threading.Lock()
+
+    def __getitem__(self, n):
+        if self.period is None and len(self.values) <= n:
+            with self.lock:
+                while self.period is None and len(self.values) <= n:
+                    self.extend()
+
+        # Чтение без блокировки: start присваивается раньше period
+        period = self.period
+        if period is not None and n >= self.start:
+            return self.values[self.start + (n - self.start) % period]
+        return self.values[n]
+
+    def extend(self):
+        """Вычисление следующего значения и поиск периода"""
+        n = len(self.values)
+        self.values.append(self.rule(self.values, n))
+        if n + 1 < self.window:
+            return
+
+        key = tuple(self.values[n + 1 - self.window:])
+        previous = self.seen.get(key)
+        if previous is None:
+            self.seen[key] = n
+            return
+
+        # Окно, заканчивающееся на previous, повторилось на n:
+        # f(i + period) = f(i) для всех i от начала этого окна
+        self.start = previous + 1 - self.window
+        self.period = n - previous
+        self.seen = None
+
+
+def grundy_rule(moves):
+    """Число Шпрага-Гранди позиции: mex значений позиций после ходов"""
+    def rule(values, n):
+        reachable = {values[n - move] for move in moves if move <= n}
+        value = 0
+        while value in reachable:
+            value += 1
+        return value
+    return rule
+
+
+def misere_rule(moves):
+    """Выигрыш в поддавки: кто не может сделать ход, тот выиграл"""
+    def rule(values, n):
+        options = [values[n - move] for move in moves if move <= n]
+        return not options or not all(options)
+    return rule
+
+
+class GameSolver:
+    """Точная стратегия для игры вычитания с кучками камней.
+
+    За ход из одной кучки берется число камней из набора moves. В
+    обычной игре побеждает взявший последний камень: позиция выигрышная,
+    если XOR чисел Шпрага-Гранди кучек не равен нулю. В поддавках
+    (misere=True) взявший последний камень проигрывает; для одной кучки
+    исход тоже берется из периодической таблицы, а несколько кучек
+    перебираются с запоминанием - это годится только для небольших
+    позиций, общей теории для них нет.
+
+    Позиция - число камней (одна кучка) или кортеж кучек.
+    """
+
+    def __init__(self, moves=(1, 2, 3), misere=False):
+        if not moves or min(moves) < 1:
+            raise ValueError("Ходы должны быть положительными числами камней")
+
+        self.moves = tuple(sorted(set(moves)))
+        self.misere = misere
+        self.grundy_table = PeriodicTable(self.moves, grundy_rule(self.moves))
+        self.misere_table = PeriodicTable(self.moves, misere_rule(self.moves))
+        self.misere_winning = lru_cache(maxsize=None)(self._misere_winning)
+
+    def grundy(self, stones):
+        """Число Шпрага-Гранди кучки из stones камней"""
+        return self.grundy_table[stones]
+
+    def legal_moves(self, stones):
+        """Сколько камней можно взять из кучки"""
+        return [move for move in self.moves if move <= stones]
+
+    def is_winning(self, position):
+        """Выигрышна ли позиция для того, кто ходит"""
+        piles = self.piles(position)
+        if not self.misere:
+            return self.nim_sum(piles) != 0
+        if len(piles) == 1:
+            return self.misere_table[piles[0]]
+        return self.misere_winning(tuple(sorted(piles)))
+
+    def winning_move(self, position):
+        """Выигрывающий ход или None, если его нет (позиция проигрышная
+        или в поддавках ходов не осталось).
+
+        Для одной кучки (position - число) - сколько взять камней, для
+        нескольких - пара (номер кучки, сколько взять).
+        """
+        piles = self.piles(position)
+        move = self.find_winning_move(piles)
+        if move is None or not isinstance(position, int):
+            return move
+        return move[1]
+
+    def find_winning_move(self, piles):
+        if not self.misere:
+            total = self.nim_sum(piles)
+            if total == 0:
+                return None
+            for index, stones in enumerate(piles):
+                # Ход, после которого XOR становится нулевым
+                target = self.grundy(stones) ^ total
+                for move in self.legal_moves(stones):
+                    if self.grundy(stones - move) == target:
+                        return index, move
+            return None
+
+        for index, stones in enumerate(piles):
+            for move in self.legal_moves(stones):
+                after = list(piles)
+                after[index] -= move
+                if not self.is_winning(tuple(after)):
+                    return index, move
+        return None
+
+    def nim_sum(self, piles):
+        total = 0
+        for stones in piles:
+            total ^= self.grundy(stones)
+        return total
+
+    def _misere_winning(self, piles):
+        """Перебор поддавков для нескольких кучек (piles отсортированы)"""
+        moved = False
+        for index, stones in enumerate(piles):
+            for move in self.legal_moves(stones):
+                moved = True
+                after = list(piles)
+                after[index] -= move
+                if not self.misere_winning(tuple(sorted(after))):
+                    return True
+        # Кто не может сделать ход, тот выиграл
+        return not moved
+
+    @staticmethod
+    def piles(position):
+        return (position,) if isinstance(position, int) else tuple(position)
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'address_book.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+UI_SOURCE_HASH = '972f52ba6c3105066cf11731b7e1f79e0b7cb1ee'
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(600, 500)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(MainWindow.sizePolicy().hasHeightForWidth())
+        MainWindow.setSizePolicy(sizePolicy)
+        MainWindow.setMinimumSize(QtCore.QSize(600, 500))
+        MainWindow.setMaximumSize(QtCore.QSize(600, 500))
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setContentsMargins(15, 15, 15, 15)
+        self.verticalLayout.setSpacing(15)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.groupBox = QtWidgets.QGroupBox(self.centralwidget)
+        self.groupBox.setObjectName("groupBox")
+        self.formLayout = QtWidgets.QFormLayout(self.groupBox)
+        self.formLayout.setContentsMargins(10, 15, 10, 10)
+        self.formLayout.setSpacing(10)
+        self.formLayout.setObjectName("formLayout")
+        self.label = QtWidgets.QLabel(self.groupBox)
+        self.label.setObjectName("label")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.label)
+        self.nameEdit = QtWidgets.QLineEdit(self.groupBox)
+        self.nameEdit.setObjectName("nameEdit")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.nameEdit)
+        self.label_2 = QtWidgets.QLabel(self.groupBox)
+        self.label_2.setObjectName("label_2")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.LabelRole, self.label_2)
+        self.phoneEdit = QtWidgets.QLineEdit(self.groupBox)
+        self.phoneEdit.setObjectName("phoneEdit")
+        self.formLayout.setWidget(1, QtWidgets.QFormLayout.FieldRole, self.phoneEdit)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setSpacing(10)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.addButton = QtWidgets.QPushButton(self.groupBox)
+        self.addButton.setStyleSheet("font-weight: bold; padding: 8px;")
+        self.addButton.setObjectName("addButton")
+        self.horizontalLayout.addWidget(self.addButton)
+        self.clearButton = QtWidgets.QPushButton(self.groupBox)
+        self.clearButton.setObjectName("clearButton")
+        self.horizontalLayout.addWidget(self.clearButton)
+        self.formLayout.setLayout(2, QtWidgets.QFormLayout.SpanningRole, self.horizontalLayout)
+        self.verticalLayout.addWidget(self.groupBox)
+        self.groupBox_2 = QtWidgets.QGroupBox(self.centralwidget)
+        self.groupBox_2.setObjectName("groupBox_2")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.groupBox_2)
+        self.verticalLayout_2.setSpacing(10)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.searchEdit = QtWidgets.QLineEdit(self.groupBox_2)
+        self.searchEdit.setClearButtonEnabled(True)
+        self.searchEdit.setObjectName("searchEdit")
+        self.verticalLayout_2.addWidget(self.searchEdit)
+        self.contactsList = QtWidgets.QListView(self.groupBox_2)
+        self.contactsList.setLayoutMode(QtWidgets.QListView.Batched)
+        self.contactsList.setBatchSize(1000)
+        self.contactsList.setUniformItemSizes(True)
+        self.contactsList.setStyleSheet("font-family: \'Segoe UI\'; font-size: 12px;")
+        self.contactsList.setObjectName("contactsList")
+        self.verticalLayout_2.addWidget(self.contactsList)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setSpacing(10)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.deleteButton = QtWidgets.QPushButton(self.groupBox_2)
+        self.deleteButton.setObjectName("deleteButton")
+        self.horizontalLayout_2.addWidget(self.deleteButton)
+        self.clearAllButton = QtWidgets.QPushButton(self.groupBox_2)
+        self.clearAllButton.setObjectName("clearAllButton")
+        self.horizontalLayout_2.addWidget(self.clearAllButton)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_2.addItem(spacerItem)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_2)
+        self.verticalLayout.addWidget(self.groupBox_2)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(MainWindow)
+        self.menubar.setObjectName("menubar")
+        self.menuFile = QtWidgets.QMenu(self.menubar)
+        self.menuFile.setObjectName("menuFile")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+        self.actionImport = QtWidgets.QAction(MainWindow)
+        self.actionImport.setObjectName("actionImport")
+        self.menuFile.addAction(self.actionImport)
+        self.menubar.addAction(self.menuFile.menuAction())
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Записная книжка"))
+        self.groupBox.setTitle(_translate("MainWindow", "Добавить контакт"))
+        self.label.setText(_translate("MainWindow", "Имя контакта:"))
+        self.nameEdit.setPlaceholderText(_translate("MainWindow", "Введите имя"))
+        self.label_2.setText(_translate("MainWindow", "Номер телефона:"))
+        self.phoneEdit.setPlaceholderText(_translate("MainWindow", "Введите номер телефона"))
+        self.addButton.setText(_translate("MainWindow", "Добавить"))
+        self.clearButton.setText(_translate("MainWindow", "Очистить поля"))
+        self.groupBox_2.setTitle(_translate("MainWindow", "Список контактов"))
+        self.searchEdit.setPlaceholderText(_translate("MainWindow", "Поиск по имени или телефону"))
+        self.deleteButton.setText(_translate("MainWindow", "Удалить выбранное"))
+        self.clearAllButton.setText(_translate("MainWindow", "Очистить все"))
+        self.menuFile.setTitle(_translate("MainWindow", "Файл"))
+        self.actionImport.setText(_translate("MainWindow", "Импорт контактов..."))
+        self.actionImport.setShortcut(_translate("MainWindow", "Ctrl+I"))
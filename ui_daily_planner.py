@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'daily_planner.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+UI_SOURCE_HASH = '91198e03e236ffbff5d3258e823081468620f074'
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(800, 600)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(MainWindow.sizePolicy().hasHeightForWidth())
+        MainWindow.setSizePolicy(sizePolicy)
+        MainWindow.setMinimumSize(QtCore.QSize(800, 600))
+        MainWindow.setMaximumSize(QtCore.QSize(800, 600))
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.horizontalLayout = QtWidgets.QHBoxLayout(self.centralwidget)
+        self.horizontalLayout.setContentsMargins(15, 15, 15, 15)
+        self.horizontalLayout.setSpacing(15)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.frame = QtWidgets.QFrame(self.centralwidget)
+        self.frame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame.setObjectName("frame")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.frame)
+        self.verticalLayout.setSpacing(10)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.label = QtWidgets.QLabel(self.frame)
+        self.label.setStyleSheet("font-size: 14px; font-weight: bold;")
+        self.label.setObjectName("label")
+        self.verticalLayout.addWidget(self.label)
+        self.label_2 = QtWidgets.QLabel(self.frame)
+        self.label_2.setObjectName("label_2")
+        self.verticalLayout.addWidget(self.label_2)
+        self.eventNameEdit = QtWidgets.QLineEdit(self.frame)
+        self.eventNameEdit.setObjectName("eventNameEdit")
+        self.verticalLayout.addWidget(self.eventNameEdit)
+        self.label_3 = QtWidgets.QLabel(self.frame)
+        self.label_3.setObjectName("label_3")
+        self.verticalLayout.addWidget(self.label_3)
+        self.calendarWidget = QtWidgets.QCalendarWidget(self.frame)
+        self.calendarWidget.setMinimumSize(QtCore.QSize(0, 200))
+        self.calendarWidget.setObjectName("calendarWidget")
+        self.verticalLayout.addWidget(self.calendarWidget)
+        self.label_4 = QtWidgets.QLabel(self.frame)
+        self.label_4.setObjectName("label_4")
+        self.verticalLayout.addWidget(self.label_4)
+        self.timeEdit = QtWidgets.QTimeEdit(self.frame)
+        self.timeEdit.setTime(QtCore.QTime(12, 0, 0))
+        self.timeEdit.setObjectName("timeEdit")
+        self.verticalLayout.addWidget(self.timeEdit)
+        self.addButton = QtWidgets.QPushButton(self.frame)
+        self.addButton.setStyleSheet("font-size: 14px; font-weight: bold; padding: 8px;")
+        self.addButton.setObjectName("addButton")
+        self.verticalLayout.addWidget(self.addButton)
+        self.deleteButton = QtWidgets.QPushButton(self.frame)
+        self.deleteButton.setObjectName("deleteButton")
+        self.verticalLayout.addWidget(self.deleteButton)
+        self.clearButton = QtWidgets.QPushButton(self.frame)
+        self.clearButton.setObjectName("clearButton")
+        self.verticalLayout.addWidget(self.clearButton)
+        self.horizontalLayout_3 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_3.setObjectName("horizontalLayout_3")
+        self.importButton = QtWidgets.QPushButton(self.frame)
+        self.importButton.setObjectName("importButton")
+        self.horizontalLayout_3.addWidget(self.importButton)
+        self.exportButton = QtWidgets.QPushButton(self.frame)
+        self.exportButton.setObjectName("exportButton")
+        self.horizontalLayout_3.addWidget(self.exportButton)
+        self.verticalLayout.addLayout(self.horizontalLayout_3)
+        spacerItem = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout.addItem(spacerItem)
+        self.horizontalLayout.addWidget(self.frame)
+        self.frame_2 = QtWidgets.QFrame(self.centralwidget)
+        self.frame_2.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.frame_2.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frame_2.setObjectName("frame_2")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.frame_2)
+        self.verticalLayout_2.setSpacing(5)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.label_5 = QtWidgets.QLabel(self.frame_2)
+        self.label_5.setStyleSheet("font-size: 14px; font-weight: bold;")
+        self.label_5.setObjectName("label_5")
+        self.horizontalLayout_2.addWidget(self.label_5)
+        self.rangeComboBox = QtWidgets.QComboBox(self.frame_2)
+        self.rangeComboBox.setObjectName("rangeComboBox")
+        self.rangeComboBox.addItem("")
+        self.rangeComboBox.addItem("")
+        self.rangeComboBox.addItem("")
+        self.rangeComboBox.addItem("")
+        self.horizontalLayout_2.addWidget(self.rangeComboBox)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_2)
+        self.eventsList = QtWidgets.QListView(self.frame_2)
+        self.eventsList.setLayoutMode(QtWidgets.QListView.Batched)
+        self.eventsList.setBatchSize(1000)
+        self.eventsList.setUniformItemSizes(True)
+        self.eventsList.setStyleSheet("font-family: \'Courier New\'; font-size: 12px;")
+        self.eventsList.setObjectName("eventsList")
+        self.verticalLayout_2.addWidget(self.eventsList)
+        self.progressBar = QtWidgets.QProgressBar(self.frame_2)
+        self.progressBar.setVisible(False)
+        self.progressBar.setObjectName("progressBar")
+        self.verticalLayout_2.addWidget(self.progressBar)
+        self.horizontalLayout.addWidget(self.frame_2)
+        MainWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Ежедневник"))
+        self.label.setText(_translate("MainWindow", "Новое событие"))
+        self.label_2.setText(_translate("MainWindow", "Название события:"))
+        self.eventNameEdit.setPlaceholderText(_translate("MainWindow", "Введите название события"))
+        self.label_3.setText(_translate("MainWindow", "Дата:"))
+        self.label_4.setText(_translate("MainWindow", "Время:"))
+        self.addButton.setText(_translate("MainWindow", "Добавить"))
+        self.deleteButton.setText(_translate("MainWindow", "Удалить выбранное"))
+        self.clearButton.setText(_translate("MainWindow", "Очистить все"))
+        self.importButton.setText(_translate("MainWindow", "Импорт..."))
+        self.exportButton.setText(_translate("MainWindow", "Экспорт..."))
+        self.label_5.setText(_translate("MainWindow", "Список событий:"))
+        self.rangeComboBox.setItemText(0, _translate("MainWindow", "Все"))
+        self.rangeComboBox.setItemText(1, _translate("MainWindow", "За день"))
+        self.rangeComboBox.setItemText(2, _translate("MainWindow", "За неделю"))
+        self.rangeComboBox.setItemText(3, _translate("MainWindow", "За месяц"))
@@ -0,0 +1,150 @@
+import argparse
+import hashlib
+import importlib
+import io
+import os
+import subprocess
+import sys
+
+
+UI_DIR = os.path.dirname(os.path.abspath(__file__))
+
+UI_FILES = [
+    'text_flag.ui',
+    'daily_planner.ui',
+    'address_book.ui',
+    'pseudonym_game.ui',
+    'plagiarism_checker.ui',
+]
+
+
+def ui_path(ui_name):
+    """Путь к файлу .ui рядом с модулем, а не в текущей папке"""
+    return os.path.join(UI_DIR, ui_name)
+
+
+def module_name(ui_name):
+    """Имя сгенерированного модуля: daily_planner.ui -> ui_daily_planner"""
+    return 'ui_' + os.path.splitext(ui_name)[0]
+
+
+def source_hash(ui_name):
+    """Хеш содержимого файла .ui - по нему видно, что модуль устарел"""
+    with open(ui_path(ui_name), 'rb') as file:
+        return hashlib.sha1(file.read()).hexdigest()
+
+
+def compile_ui(ui_name):
+    """Генерация модуля интерфейса из файла .ui (как pyuic5) с хешем исходника"""
+    from PyQt5 import uic
+
+    output = io.StringIO()
+    uic.compileUi(ui_path(ui_name), output)
+    # В заголовке pyuic5 путь к файлу абсолютный - в репозитории он не нужен
+    code = output.getvalue().replace(ui_path(ui_name), ui_name)
+    code = code.replace('\n\nfrom PyQt5', f"\n\nUI_SOURCE_HASH = '{source_hash(ui_name)}'\n\nfrom PyQt5", 1)
+
+    path = os.path.join(UI_DIR, module_name(ui_name) + '.py')
+    with open(path, 'w', encoding='utf-8', newline='\n') as file:
+        file.write(code)
+    return path
+
+
+def load_ui(widget, ui_name):
+    """Построение интерфейса окна из сгенерированного модуля.
+
+    Модуль не разбирает XML и не тянет за собой uic, поэтому окно
+    открывается быстрее. Если модуля нет или файл .ui изменился после
+    генерации (не совпал хеш), интерфейс загружается из .ui через loadUi.
+    Как и loadUi, функция делает виджеты атрибутами widget.
+    """
+    try:
+        module = importlib.import_module(module_name(ui_name))
+    except ImportError:
+        module = None
+
+    if module is None or getattr(module, 'UI_SOURCE_HASH', None) != source_hash(ui_name):
+        from PyQt5 import uic
+        uic.loadUi(ui_path(ui_name), widget)
+        return
+
+    ui = module.Ui_MainWindow()
+    ui.setupUi(widget)
+    for name, value in vars(ui).items():
+        setattr(widget, name, value)
+
+
+BENCHMARK_CODE = '''
+import sys, time
+from PyQt5 import QtWidgets
+app = QtWidgets.QApplication(sys.argv)
+ready = time.perf_counter()
+window = QtWidgets.QMainWindow()
+if sys.argv[2] == 'loadUi':
+    from PyQt5 import uic
+    uic.loadUi(sys.argv[3], window)
+else:
+    import ui_loader
+    ui_loader.load_ui(window, sys.argv[1])
+print(time.perf_counter() - ready)
+'''
+
+
+def benchmark(repeat):
+    """Время построения окна при запуске: loadUi против сгенерированного модуля.
+
+    Каждый замер - отдельный процесс, чтобы в него входили импорт uic и
+    первое обращение к модулю, как при настоящем запуске приложения.
+    """
+    env = dict(os.environ, PYTHONPATH=UI_DIR)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    print(f"{'интерфейс':<24}{'loadUi, мс':>12}{'модуль, мс':>12}{'ускорение':>11}")
+    for ui_name in UI_FILES:
+        times = {}
+        for method in ('loadUi', 'module'):
+            runs = []
+            for _ in range(repeat):
+                result = subprocess.run(
+                    [sys.executable, '-c', BENCHMARK_CODE, ui_name, method, ui_path(ui_name)],
+                    capture_output=True, text=True, env=env, check=True
+                )
+                runs.append(float(result.stdout.split()[-1]))
+            times[method] = min(runs) * 1000
+        print(f"{ui_name:<24}{times['loadUi']:>12.1f}{times['module']:>12.1f}"
+              f"{times['loadUi'] / times['module']:>10.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Генерация модулей интерфейса из файлов .ui")
+    parser.add_argument('--check', action='store_true', help="только проверить, что модули не устарели")
+    parser.add_argument('--benchmark', action='store_true', help="сравнить время запуска с loadUi")
+    parser.add_argument('--repeat', type=int, default=5, help="число запусков в замере")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.repeat)
+        return
+
+    stale = []
+    for ui_name in UI_FILES:
+        try:
+            module = importlib.import_module(module_name(ui_name))
+            fresh = getattr(module, 'UI_SOURCE_HASH', None) == source_hash(ui_name)
+        except ImportError:
+            fresh = False
+
+        if fresh:
+            continue
+        if args.check:
+            stale.append(ui_name)
+        else:
+            print(f"{ui_name} -> {os.path.basename(compile_ui(ui_name))}")
+
+    if stale:
+        print("Устарели модули для: " + ", ".join(stale))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
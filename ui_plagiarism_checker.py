@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'plagiarism_checker.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+UI_SOURCE_HASH = '945cb8bd3ac4134fac84f81ec0a6907de0c0afb8'
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(900, 700)
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setContentsMargins(15, 15, 15, 15)
+        self.verticalLayout.setSpacing(15)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.settingsGroup = QtWidgets.QGroupBox(self.centralwidget)
+        self.settingsGroup.setObjectName("settingsGroup")
+        self.settingsLayout = QtWidgets.QVBoxLayout(self.settingsGroup)
+        self.settingsLayout.setContentsMargins(10, 10, 10, 10)
+        self.settingsLayout.setSpacing(10)
+        self.settingsLayout.setObjectName("settingsLayout")
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setSpacing(10)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.label = QtWidgets.QLabel(self.settingsGroup)
+        self.label.setObjectName("label")
+        self.horizontalLayout.addWidget(self.label)
+        self.thresholdSpinBox = QtWidgets.QDoubleSpinBox(self.settingsGroup)
+        self.thresholdSpinBox.setMinimum(0.0)
+        self.thresholdSpinBox.setMaximum(100.0)
+        self.thresholdSpinBox.setSingleStep(1.0)
+        self.thresholdSpinBox.setProperty("value", 70.0)
+        self.thresholdSpinBox.setObjectName("thresholdSpinBox")
+        self.horizontalLayout.addWidget(self.thresholdSpinBox)
+        self.livePreviewCheckBox = QtWidgets.QCheckBox(self.settingsGroup)
+        self.livePreviewCheckBox.setObjectName("livePreviewCheckBox")
+        self.horizontalLayout.addWidget(self.livePreviewCheckBox)
+        self.sequenceComboBox = QtWidgets.QComboBox(self.settingsGroup)
+        self.sequenceComboBox.setObjectName("sequenceComboBox")
+        self.horizontalLayout.addWidget(self.sequenceComboBox)
+        spacerItem = QtWidgets.QSpacerItem(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem)
+        self.settingsLayout.addLayout(self.horizontalLayout)
+        self.buttonsLayout = QtWidgets.QHBoxLayout()
+        self.buttonsLayout.setSpacing(10)
+        self.buttonsLayout.setObjectName("buttonsLayout")
+        self.checkButton = QtWidgets.QPushButton(self.settingsGroup)
+        self.checkButton.setStyleSheet("font-weight: bold; padding: 8px;")
+        self.checkButton.setObjectName("checkButton")
+        self.buttonsLayout.addWidget(self.checkButton)
+        self.corpusCheckButton = QtWidgets.QPushButton(self.settingsGroup)
+        self.corpusCheckButton.setObjectName("corpusCheckButton")
+        self.buttonsLayout.addWidget(self.corpusCheckButton)
+        self.loadCorpusButton = QtWidgets.QPushButton(self.settingsGroup)
+        self.loadCorpusButton.setObjectName("loadCorpusButton")
+        self.buttonsLayout.addWidget(self.loadCorpusButton)
+        self.cancelButton = QtWidgets.QPushButton(self.settingsGroup)
+        self.cancelButton.setEnabled(False)
+        self.cancelButton.setObjectName("cancelButton")
+        self.buttonsLayout.addWidget(self.cancelButton)
+        self.clearButton = QtWidgets.QPushButton(self.settingsGroup)
+        self.clearButton.setObjectName("clearButton")
+        self.buttonsLayout.addWidget(self.clearButton)
+        self.settingsLayout.addLayout(self.buttonsLayout)
+        self.verticalLayout.addWidget(self.settingsGroup)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setSpacing(10)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.text1Group = QtWidgets.QGroupBox(self.centralwidget)
+        self.text1Group.setObjectName("text1Group")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.text1Group)
+        self.verticalLayout_2.setSpacing(5)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.originalTextEdit = QtWidgets.QTextEdit(self.text1Group)
+        self.originalTextEdit.setObjectName("originalTextEdit")
+        self.verticalLayout_2.addWidget(self.originalTextEdit)
+        self.openFile1Button = QtWidgets.QPushButton(self.text1Group)
+        self.openFile1Button.setObjectName("openFile1Button")
+        self.verticalLayout_2.addWidget(self.openFile1Button)
+        self.text1StatsLabel = QtWidgets.QLabel(self.text1Group)
+        self.text1StatsLabel.setStyleSheet("color: #7f8c8d; font-size: 11px;")
+        self.text1StatsLabel.setObjectName("text1StatsLabel")
+        self.verticalLayout_2.addWidget(self.text1StatsLabel)
+        self.horizontalLayout_2.addWidget(self.text1Group)
+        self.text2Group = QtWidgets.QGroupBox(self.centralwidget)
+        self.text2Group.setObjectName("text2Group")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.text2Group)
+        self.verticalLayout_3.setSpacing(5)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.checkedTextEdit = QtWidgets.QTextEdit(self.text2Group)
+        self.checkedTextEdit.setObjectName("checkedTextEdit")
+        self.verticalLayout_3.addWidget(self.checkedTextEdit)
+        self.openFile2Button = QtWidgets.QPushButton(self.text2Group)
+        self.openFile2Button.setObjectName("openFile2Button")
+        self.verticalLayout_3.addWidget(self.openFile2Button)
+        self.text2StatsLabel = QtWidgets.QLabel(self.text2Group)
+        self.text2StatsLabel.setStyleSheet("color: #7f8c8d; font-size: 11px;")
+        self.text2StatsLabel.setObjectName("text2StatsLabel")
+        self.verticalLayout_3.addWidget(self.text2StatsLabel)
+        self.horizontalLayout_2.addWidget(self.text2Group)
+        self.verticalLayout.addLayout(self.horizontalLayout_2)
+        self.resultGroup = QtWidgets.QGroupBox(self.centralwidget)
+        self.resultGroup.setObjectName("resultGroup")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.resultGroup)
+        self.verticalLayout_4.setSpacing(10)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.similarityLabel = QtWidgets.QLabel(self.resultGroup)
+        self.similarityLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.similarityLabel.setStyleSheet("font-size: 16px; font-weight: bold; color: #27ae60;")
+        self.similarityLabel.setObjectName("similarityLabel")
+        self.verticalLayout_4.addWidget(self.similarityLabel)
+        self.progressBar = QtWidgets.QProgressBar(self.resultGroup)
+        self.progressBar.setProperty("value", 0)
+        self.progressBar.setVisible(False)
+        self.progressBar.setObjectName("progressBar")
+        self.verticalLayout_4.addWidget(self.progressBar)
+        self.detailsTextEdit = QtWidgets.QTextEdit(self.resultGroup)
+        self.detailsTextEdit.setReadOnly(True)
+        self.detailsTextEdit.setStyleSheet("font-family: \'Courier New\'; font-size: 11px; background-color: #f8f9fa;")
+        self.detailsTextEdit.setObjectName("detailsTextEdit")
+        self.verticalLayout_4.addWidget(self.detailsTextEdit)
+        self.verticalLayout.addWidget(self.resultGroup)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.statusbar = QtWidgets.QStatusBar(MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Проверка на антиплагиат"))
+        self.settingsGroup.setTitle(_translate("MainWindow", "Настройки проверки"))
+        self.label.setText(_translate("MainWindow", "Порог срабатывания (%):"))
+        self.thresholdSpinBox.setSuffix(_translate("MainWindow", "%"))
+        self.livePreviewCheckBox.setText(_translate("MainWindow", "Живая оценка"))
+        self.livePreviewCheckBox.setToolTip(_translate("MainWindow", "Предварительная схожесть по словам и биграммам во время набора"))
+        self.sequenceComboBox.setToolTip(_translate("MainWindow", "Способ последовательного сравнения текстов"))
+        self.checkButton.setText(_translate("MainWindow", "Проверить на плагиат"))
+        self.corpusCheckButton.setText(_translate("MainWindow", "Проверить по корпусу"))
+        self.loadCorpusButton.setText(_translate("MainWindow", "Загрузить корпус..."))
+        self.cancelButton.setText(_translate("MainWindow", "Отменить"))
+        self.clearButton.setText(_translate("MainWindow", "Очистить"))
+        self.text1Group.setTitle(_translate("MainWindow", "Исходный текст"))
+        self.originalTextEdit.setPlaceholderText(_translate("MainWindow", "Введите исходный текст здесь..."))
+        self.openFile1Button.setText(_translate("MainWindow", "Открыть файл..."))
+        self.text1StatsLabel.setText(_translate("MainWindow", "Символов: 0, Слов: 0"))
+        self.text2Group.setTitle(_translate("MainWindow", "Проверяемый текст"))
+        self.checkedTextEdit.setPlaceholderText(_translate("MainWindow", "Введите текст для проверки здесь..."))
+        self.openFile2Button.setText(_translate("MainWindow", "Открыть файл..."))
+        self.text2StatsLabel.setText(_translate("MainWindow", "Символов: 0, Слов: 0"))
+        self.resultGroup.setTitle(_translate("MainWindow", "Результат проверки"))
+        self.similarityLabel.setText(_translate("MainWindow", "Схожесть: 0.00%"))
+        self.progressBar.setFormat(_translate("MainWindow", "Проверено строк: %v из %m"))
+        self.detailsTextEdit.setPlaceholderText(_translate("MainWindow", "Здесь будет отображаться подробная информация о проверке..."))
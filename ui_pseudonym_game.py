@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'pseudonym_game.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+UI_SOURCE_HASH = '23b5540c3f204e9bb213cb82bf6b05c2706b0f73'
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(500, 600)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(MainWindow.sizePolicy().hasHeightForWidth())
+        MainWindow.setSizePolicy(sizePolicy)
+        MainWindow.setMinimumSize(QtCore.QSize(500, 600))
+        MainWindow.setMaximumSize(QtCore.QSize(500, 600))
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setContentsMargins(20, 20, 20, 20)
+        self.verticalLayout.setSpacing(15)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.titleLabel = QtWidgets.QLabel(self.centralwidget)
+        self.titleLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.titleLabel.setStyleSheet("font-size: 18px; font-weight: bold; color: #2c3e50;")
+        self.titleLabel.setObjectName("titleLabel")
+        self.verticalLayout.addWidget(self.titleLabel)
+        self.setupGroup = QtWidgets.QGroupBox(self.centralwidget)
+        self.setupGroup.setObjectName("setupGroup")
+        self.formLayout = QtWidgets.QFormLayout(self.setupGroup)
+        self.formLayout.setContentsMargins(10, 15, 10, 10)
+        self.formLayout.setSpacing(10)
+        self.formLayout.setObjectName("formLayout")
+        self.label = QtWidgets.QLabel(self.setupGroup)
+        self.label.setObjectName("label")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.LabelRole, self.label)
+        self.stonesSpinBox = QtWidgets.QSpinBox(self.setupGroup)
+        self.stonesSpinBox.setMinimum(4)
+        self.stonesSpinBox.setMaximum(100)
+        self.stonesSpinBox.setProperty("value", 15)
+        self.stonesSpinBox.setObjectName("stonesSpinBox")
+        self.formLayout.setWidget(0, QtWidgets.QFormLayout.FieldRole, self.stonesSpinBox)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.newGameButton = QtWidgets.QPushButton(self.setupGroup)
+        self.newGameButton.setStyleSheet("font-weight: bold; padding: 8px;")
+        self.newGameButton.setObjectName("newGameButton")
+        self.horizontalLayout.addWidget(self.newGameButton)
+        self.saveLogButton = QtWidgets.QPushButton(self.setupGroup)
+        self.saveLogButton.setStyleSheet("padding: 8px;")
+        self.saveLogButton.setObjectName("saveLogButton")
+        self.horizontalLayout.addWidget(self.saveLogButton)
+        self.formLayout.setLayout(1, QtWidgets.QFormLayout.SpanningRole, self.horizontalLayout)
+        self.verticalLayout.addWidget(self.setupGroup)
+        self.gameGroup = QtWidgets.QGroupBox(self.centralwidget)
+        self.gameGroup.setObjectName("gameGroup")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.gameGroup)
+        self.verticalLayout_2.setSpacing(10)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.stonesLabel = QtWidgets.QLabel(self.gameGroup)
+        self.stonesLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.stonesLabel.setStyleSheet("font-size: 16px; font-weight: bold; color: #e74c3c;")
+        self.stonesLabel.setObjectName("stonesLabel")
+        self.verticalLayout_2.addWidget(self.stonesLabel)
+        self.turnLabel = QtWidgets.QLabel(self.gameGroup)
+        self.turnLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.turnLabel.setStyleSheet("font-size: 14px; color: #7f8c8d;")
+        self.turnLabel.setObjectName("turnLabel")
+        self.verticalLayout_2.addWidget(self.turnLabel)
+        self.horizontalLayout_2 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_2.setSpacing(5)
+        self.horizontalLayout_2.setObjectName("horizontalLayout_2")
+        self.take1Button = QtWidgets.QPushButton(self.gameGroup)
+        self.take1Button.setMinimumSize(QtCore.QSize(0, 40))
+        self.take1Button.setObjectName("take1Button")
+        self.horizontalLayout_2.addWidget(self.take1Button)
+        self.take2Button = QtWidgets.QPushButton(self.gameGroup)
+        self.take2Button.setMinimumSize(QtCore.QSize(0, 40))
+        self.take2Button.setObjectName("take2Button")
+        self.horizontalLayout_2.addWidget(self.take2Button)
+        self.take3Button = QtWidgets.QPushButton(self.gameGroup)
+        self.take3Button.setMinimumSize(QtCore.QSize(0, 40))
+        self.take3Button.setObjectName("take3Button")
+        self.horizontalLayout_2.addWidget(self.take3Button)
+        self.verticalLayout_2.addLayout(self.horizontalLayout_2)
+        self.infoLabel = QtWidgets.QLabel(self.gameGroup)
+        self.infoLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.infoLabel.setStyleSheet("font-size: 12px; color: #95a5a6;")
+        self.infoLabel.setObjectName("infoLabel")
+        self.verticalLayout_2.addWidget(self.infoLabel)
+        self.verticalLayout.addWidget(self.gameGroup)
+        self.logGroup = QtWidgets.QGroupBox(self.centralwidget)
+        self.logGroup.setObjectName("logGroup")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.logGroup)
+        self.verticalLayout_3.setSpacing(5)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.logText = QtWidgets.QPlainTextEdit(self.logGroup)
+        self.logText.setReadOnly(True)
+        self.logText.setStyleSheet("font-family: \'Courier New\'; font-size: 11px; background-color: #f8f9fa;")
+        self.logText.setObjectName("logText")
+        self.verticalLayout_3.addWidget(self.logText)
+        self.verticalLayout.addWidget(self.logGroup)
+        MainWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Игра \"Псевдоним\""))
+        self.titleLabel.setText(_translate("MainWindow", "Игра \"Псевдоним\""))
+        self.setupGroup.setTitle(_translate("MainWindow", "Настройка игры"))
+        self.label.setText(_translate("MainWindow", "Количество камней:"))
+        self.newGameButton.setText(_translate("MainWindow", "Новая игра"))
+        self.saveLogButton.setText(_translate("MainWindow", "Сохранить лог..."))
+        self.gameGroup.setTitle(_translate("MainWindow", "Игровой процесс"))
+        self.stonesLabel.setText(_translate("MainWindow", "Камней на столе: 0"))
+        self.turnLabel.setText(_translate("MainWindow", "Ожидание начала игры"))
+        self.take1Button.setText(_translate("MainWindow", "Взять 1"))
+        self.take2Button.setText(_translate("MainWindow", "Взять 2"))
+        self.take3Button.setText(_translate("MainWindow", "Взять 3"))
+        self.infoLabel.setText(_translate("MainWindow", "Выберите количество камней для хода"))
+        self.logGroup.setTitle(_translate("MainWindow", "Ход игры"))
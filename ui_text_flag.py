@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'text_flag.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+UI_SOURCE_HASH = 'f36c920f6d9c5dab6b02a8a5ac887c7bbaaae785'
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(450, 760)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(MainWindow.sizePolicy().hasHeightForWidth())
+        MainWindow.setSizePolicy(sizePolicy)
+        MainWindow.setMinimumSize(QtCore.QSize(450, 760))
+        MainWindow.setMaximumSize(QtCore.QSize(450, 760))
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.centralwidget)
+        self.verticalLayout.setContentsMargins(15, 15, 15, 15)
+        self.verticalLayout.setSpacing(10)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.groupBox = QtWidgets.QGroupBox(self.centralwidget)
+        self.groupBox.setObjectName("groupBox")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.groupBox)
+        self.verticalLayout_2.setContentsMargins(10, 15, 10, 10)
+        self.verticalLayout_2.setSpacing(5)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.top_red = QtWidgets.QRadioButton(self.groupBox)
+        self.top_red.setChecked(True)
+        self.top_red.setObjectName("top_red")
+        self.verticalLayout_2.addWidget(self.top_red)
+        self.top_blue = QtWidgets.QRadioButton(self.groupBox)
+        self.top_blue.setObjectName("top_blue")
+        self.verticalLayout_2.addWidget(self.top_blue)
+        self.top_green = QtWidgets.QRadioButton(self.groupBox)
+        self.top_green.setObjectName("top_green")
+        self.verticalLayout_2.addWidget(self.top_green)
+        self.top_yellow = QtWidgets.QRadioButton(self.groupBox)
+        self.top_yellow.setObjectName("top_yellow")
+        self.verticalLayout_2.addWidget(self.top_yellow)
+        self.top_white = QtWidgets.QRadioButton(self.groupBox)
+        self.top_white.setObjectName("top_white")
+        self.verticalLayout_2.addWidget(self.top_white)
+        self.verticalLayout.addWidget(self.groupBox)
+        self.groupBox_2 = QtWidgets.QGroupBox(self.centralwidget)
+        self.groupBox_2.setObjectName("groupBox_2")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.groupBox_2)
+        self.verticalLayout_3.setContentsMargins(10, 15, 10, 10)
+        self.verticalLayout_3.setSpacing(5)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.middle_red = QtWidgets.QRadioButton(self.groupBox_2)
+        self.middle_red.setObjectName("middle_red")
+        self.verticalLayout_3.addWidget(self.middle_red)
+        self.middle_blue = QtWidgets.QRadioButton(self.groupBox_2)
+        self.middle_blue.setObjectName("middle_blue")
+        self.verticalLayout_3.addWidget(self.middle_blue)
+        self.middle_green = QtWidgets.QRadioButton(self.groupBox_2)
+        self.middle_green.setChecked(True)
+        self.middle_green.setObjectName("middle_green")
+        self.verticalLayout_3.addWidget(self.middle_green)
+        self.middle_yellow = QtWidgets.QRadioButton(self.groupBox_2)
+        self.middle_yellow.setObjectName("middle_yellow")
+        self.verticalLayout_3.addWidget(self.middle_yellow)
+        self.middle_white = QtWidgets.QRadioButton(self.groupBox_2)
+        self.middle_white.setObjectName("middle_white")
+        self.verticalLayout_3.addWidget(self.middle_white)
+        self.verticalLayout.addWidget(self.groupBox_2)
+        self.groupBox_3 = QtWidgets.QGroupBox(self.centralwidget)
+        self.groupBox_3.setObjectName("groupBox_3")
+        self.verticalLayout_4 = QtWidgets.QVBoxLayout(self.groupBox_3)
+        self.verticalLayout_4.setContentsMargins(10, 15, 10, 10)
+        self.verticalLayout_4.setSpacing(5)
+        self.verticalLayout_4.setObjectName("verticalLayout_4")
+        self.bottom_red = QtWidgets.QRadioButton(self.groupBox_3)
+        self.bottom_red.setObjectName("bottom_red")
+        self.verticalLayout_4.addWidget(self.bottom_red)
+        self.bottom_blue = QtWidgets.QRadioButton(self.groupBox_3)
+        self.bottom_blue.setObjectName("bottom_blue")
+        self.verticalLayout_4.addWidget(self.bottom_blue)
+        self.bottom_green = QtWidgets.QRadioButton(self.groupBox_3)
+        self.bottom_green.setObjectName("bottom_green")
+        self.verticalLayout_4.addWidget(self.bottom_green)
+        self.bottom_yellow = QtWidgets.QRadioButton(self.groupBox_3)
+        self.bottom_yellow.setObjectName("bottom_yellow")
+        self.verticalLayout_4.addWidget(self.bottom_yellow)
+        self.bottom_white = QtWidgets.QRadioButton(self.groupBox_3)
+        self.bottom_white.setChecked(True)
+        self.bottom_white.setObjectName("bottom_white")
+        self.verticalLayout_4.addWidget(self.bottom_white)
+        self.verticalLayout.addWidget(self.groupBox_3)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setSpacing(10)
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.drawButton = QtWidgets.QPushButton(self.centralwidget)
+        self.drawButton.setMinimumSize(QtCore.QSize(0, 40))
+        self.drawButton.setStyleSheet("font-size: 14px; font-weight: bold;")
+        self.drawButton.setObjectName("drawButton")
+        self.horizontalLayout.addWidget(self.drawButton)
+        self.exportButton = QtWidgets.QPushButton(self.centralwidget)
+        self.exportButton.setMinimumSize(QtCore.QSize(0, 40))
+        self.exportButton.setObjectName("exportButton")
+        self.horizontalLayout.addWidget(self.exportButton)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+        self.flagLabel = QtWidgets.QLabel(self.centralwidget)
+        self.flagLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.flagLabel.setMinimumSize(QtCore.QSize(0, 190))
+        self.flagLabel.setObjectName("flagLabel")
+        self.verticalLayout.addWidget(self.flagLabel)
+        self.resultLabel = QtWidgets.QLabel(self.centralwidget)
+        self.resultLabel.setAlignment(QtCore.Qt.AlignCenter)
+        self.resultLabel.setStyleSheet("font-size: 16px; font-weight: bold; padding: 15px; background-color: #f0f0f0; border-radius: 5px;")
+        self.resultLabel.setFrameShape(QtWidgets.QFrame.Box)
+        self.resultLabel.setMinimumSize(QtCore.QSize(0, 60))
+        self.resultLabel.setObjectName("resultLabel")
+        self.verticalLayout.addWidget(self.resultLabel)
+        MainWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Текстовый флаг"))
+        self.groupBox.setTitle(_translate("MainWindow", "Верхняя полоса"))
+        self.top_red.setText(_translate("MainWindow", "Красный"))
+        self.top_blue.setText(_translate("MainWindow", "Синий"))
+        self.top_green.setText(_translate("MainWindow", "Зеленый"))
+        self.top_yellow.setText(_translate("MainWindow", "Желтый"))
+        self.top_white.setText(_translate("MainWindow", "Белый"))
+        self.groupBox_2.setTitle(_translate("MainWindow", "Средняя полоса"))
+        self.middle_red.setText(_translate("MainWindow", "Красный"))
+        self.middle_blue.setText(_translate("MainWindow", "Синий"))
+        self.middle_green.setText(_translate("MainWindow", "Зеленый"))
+        self.middle_yellow.setText(_translate("MainWindow", "Желтый"))
+        self.middle_white.setText(_translate("MainWindow", "Белый"))
+        self.groupBox_3.setTitle(_translate("MainWindow", "Нижняя полоса"))
+        self.bottom_red.setText(_translate("MainWindow", "Красный"))
+        self.bottom_blue.setText(_translate("MainWindow", "Синий"))
+        self.bottom_green.setText(_translate("MainWindow", "Зеленый"))
+        self.bottom_yellow.setText(_translate("MainWindow", "Желтый"))
+        self.bottom_white.setText(_translate("MainWindow", "Белый"))
+        self.drawButton.setText(_translate("MainWindow", "Нарисовать"))
+        self.exportButton.setText(_translate("MainWindow", "Экспорт..."))
+        self.resultLabel.setText(_translate("MainWindow", "Выберите цвета полос"))